@@ -1,4 +1,39 @@
 import heapq
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+def _count_completions(n, blocked, row, cols, ld, rd):
+    """
+    DFS me maska bitësh (si te a_star_bitboard) që numëron plotësimet
+    nga rreshti 'row' deri në fund. ld/rd janë diagonalet e sulmuara në rreshtin 'row'.
+    """
+    full = (1 << n) - 1
+
+    def count(row, cols, ld, rd):
+        if row == n:
+            return 1
+        total = 0
+        available = full & ~(cols | ld | rd | blocked[row])
+        while available:
+            bit = available & -available
+            available ^= bit
+            total += count(row + 1, cols | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1)
+        return total
+
+    return count(row, cols, ld, rd)
+
+def _count_subtree(task):
+    """Punëtori i pool-it: numëron zgjidhjet që fillojnë me kolonat e dhëna në 'prefix'."""
+    n, blocked, prefix, weight = task
+    full = (1 << n) - 1
+    cols = ld = rd = 0
+    for col in prefix:
+        bit = 1 << col
+        cols |= bit
+        ld = ((ld | bit) << 1) & full
+        rd = (rd | bit) >> 1
+    return weight * _count_completions(n, blocked, len(prefix), cols, ld, rd)
 
 class BlockedNQueens:
     def __init__(self, n, blocked_positions):
@@ -143,6 +178,300 @@ class BlockedNQueens:
 
         return None  # Nëse skadon prioriteti dhe s'ka zgjidhje, kthe None
 
+    # ---------------------------
+    #   A* ME BITBOARDS
+    # ---------------------------
+    def _blocked_row_masks(self):
+        """Maska e kuadrateve të bllokuara për secilin rresht (biti c = kolona c)."""
+        masks = [0] * self.n
+        for (r, c) in self.blocked_positions:
+            if 0 <= r < self.n and 0 <= c < self.n:
+                masks[r] |= 1 << c
+        return masks
+
+    def a_star_bitboard(self, heuristic_choice=1):
+        """
+        A* me gjendje kompakte: gjendja është (rreshtat e mbushur, kolonat e zëna,
+        diagonalet r+c, diagonalet c-r), secila si maskë bitësh, plus maska e kuadrateve
+        të bllokuara e llogaritur paraprakisht për çdo rresht.
+        Për çdo heuristikë kontrollohen të gjithë rreshtat e mbetur: gjendja pritet kur një rresht
+        s'ka kolonë të lirë ose kur një kolonë e lirë s'arrihet nga asnjë rresht, dhe si rresht
+        i ardhshëm zgjidhet ai me më pak kolona të lira (MRV). Pa këtë, mbushja e rreshtave me
+        radhë nuk përfundon brenda minutash për n=30 me kuadrate të bllokuara.
+          - h1 dhe h2: h = mbretëreshat e mbetura (bllokimi i rreshtit të ardhshëm te h2
+            mbulohet nga kontrolli i mësipërm)
+          - h3: e njëjta h, por në barazim preferohen gjendjet me më shumë kuadrate të lira
+        Vlerat e heuristikës ruhen sipas çelësit të gjendjes (memoizim), ndërsa
+        gjendjet e zgjeruara ruhen në një 'closed set', sepse e ardhmja varet vetëm
+        nga maskat dhe jo nga rruga deri aty.
+
+        :return: e njëjta listë kolonash si te a_star (ose None nëse s'ka zgjidhje).
+        """
+        n = self.n
+        full = (1 << n) - 1
+        blocked = self._blocked_row_masks()
+        h_cache = {}
+
+        def free_columns(r, cols, diag, anti):
+            # diag ka bitin (r + c), anti ka bitin (c - r + n - 1)
+            return full & ~(cols | (diag >> r) | (anti >> (n - 1 - r)) | blocked[r])
+
+        def evaluate(rows, cols, diag, anti):
+            """
+            Kthen (h, liria, rreshti i ardhshëm, kolonat e lira të tij).
+            'liria' = numri i kuadrateve të lira në rreshtat e kontrolluar; përdoret vetëm
+            për barazimet në kupë (preferohen gjendjet më pak të kufizuara).
+            """
+            key = (rows, cols, diag, anti)
+            cached = h_cache.get(key)
+            if cached is not None:
+                return cached
+
+            remaining = n - bin(rows).count("1")
+            if remaining == 0:
+                result = (0, 0, -1, 0)
+            else:
+                freedom, reachable = 0, 0
+                best_row, best_free, best_count = -1, 0, n + 1
+                for r in range(n):
+                    if rows >> r & 1:
+                        continue
+                    free = free_columns(r, cols, diag, anti)
+                    count = bin(free).count("1")
+                    if count == 0:
+                        break
+                    freedom += count
+                    reachable |= free
+                    if count < best_count:
+                        best_row, best_free, best_count = r, free, count
+                else:
+                    # Çdo kolonë e lirë duhet të jetë e arritshme nga ndonjë rresht i mbetur
+                    if reachable == full & ~cols:
+                        if heuristic_choice != 3:
+                            freedom = 0  # pa barazues: h1/h2 renditen vetëm sipas f dhe thellësisë
+                        result = (remaining, freedom, best_row, best_free)
+                        h_cache[key] = result
+                        return result
+                result = (999999, 0, -1, 0)  # Bllokim i plotë -> kosto e madhe
+            h_cache[key] = result
+            return result
+
+        # Elementet e kupës: (f, -g, -liria, numëruesi, g, rows, cols, diag, anti, rruga)
+        # Rruga ruhet si listë e lidhur (rreshti, kolona, prindi) që të mos kopjohet në çdo hap.
+        counter = 0
+        h, freedom, _, _ = evaluate(0, 0, 0, 0)
+        pq = [(h, 0, -freedom, counter, 0, 0, 0, 0, 0, None)]
+        closed = set()
+
+        while pq:
+            _, _, _, _, g, rows, cols, diag, anti, path = heapq.heappop(pq)
+            if g == n:
+                solution = [0] * n
+                while path is not None:
+                    row, col, path = path
+                    solution[row] = col
+                return solution
+
+            key = (rows, cols, diag, anti)
+            if key in closed:
+                continue
+            closed.add(key)
+
+            h, _, row, available = evaluate(rows, cols, diag, anti)
+            if h >= 999999:
+                continue
+            while available:
+                bit = available & -available
+                available ^= bit
+                col = bit.bit_length() - 1
+                child = (rows | 1 << row, cols | bit, diag | 1 << (row + col), anti | 1 << (col - row + n - 1))
+                h, freedom, _, _ = evaluate(*child)
+                if h >= 999999:
+                    continue
+                counter += 1
+                heapq.heappush(pq, (g + 1 + h, -(g + 1), -freedom, counter, g + 1) + child
+                               + ((row, col, path),))
+
+        return None
+
+    # ---------------------------
+    #   MIN-CONFLICTS (LOKAL)
+    # ---------------------------
+    def min_conflicts(self, max_iterations=None, max_restarts=10, seed=None):
+        """
+        Kërkim lokal për tabela shumë të mëdha (n deri në qindra mijë).
+        Gjendja është një permutacion i kolonave (një mbretëreshë për rresht dhe kolonë),
+        prandaj mbeten vetëm konfliktet diagonale. Numëruesit për secilën diagonale
+        përditësohen në O(1) pas çdo shkëmbimi të dy rreshtave.
+          1) Vendosja fillestare: rreshtat mbushen me radhë duke provuar kolona të rastësishme
+             nga ato që kanë mbetur dhe pranohet e para pa konflikt dhe jo e bllokuar.
+          2) Riparimi: për një rresht në konflikt provohet shkëmbimi me një rresht të rastësishëm
+             dhe pranohet nëse zvogëlon konfliktet.
+        Kuadratet e bllokuara nuk zihen kurrë.
+
+        :param max_iterations: numri maksimal i shkëmbimeve të provuara për çdo rinisje (parazgjedhur 20n)
+        :param max_restarts: numri i rinisjeve nëse kufiri arrihet pa zgjidhje
+        :return: listë kolonash për secilin rresht ose None nëse nuk u gjet zgjidhje.
+        """
+        n = self.n
+        if n == 1:
+            return [0] if (0, 0) not in self.blocked_positions else None
+        if max_iterations is None:
+            max_iterations = 20 * n
+        rng = random.Random(seed)
+        rnd = rng.random  # më i shpejtë se randrange në ciklet e nxehta
+        blocked = self.blocked_positions
+
+        for _ in range(max_restarts + 1):
+            # Rendi fillestar nuk ka rëndësi: kolonat zgjidhen rastësisht më poshtë
+            queens = list(range(n))
+            diag = [0] * (2 * n - 1)   # r + c
+            anti = [0] * (2 * n - 1)   # r - c + n - 1
+
+            # 1) Vendosja fillestare e pangopur (greedy) me kolona të rastësishme pa konflikt
+            row = 0
+            attempts = 0
+            while row < n and attempts < 3 * n:
+                j = row + int(rnd() * (n - row))
+                col = queens[j]
+                attempts += 1
+                if diag[row + col] or anti[row - col + n - 1] or (row, col) in blocked:
+                    continue
+                queens[row], queens[j] = col, queens[row]
+                diag[row + col] += 1
+                anti[row - col + n - 1] += 1
+                row += 1
+
+            # Rreshtat e mbetur marrin kolonat e mbetura, duke shmangur kuadratet e bllokuara
+            for r in range(row, n):
+                for j in range(r, n):
+                    if (r, queens[j]) not in blocked:
+                        queens[r], queens[j] = queens[j], queens[r]
+                        break
+                diag[r + queens[r]] += 1
+                anti[r - queens[r] + n - 1] += 1
+
+            def conflicts(r):
+                c = queens[r]
+                return diag[r + c] + anti[r - c + n - 1] - 2 + (n if (r, c) in blocked else 0)
+
+            def conflicted_rows():
+                # Vetëm diagonalet me më shumë se një mbretëreshë dhe kuadratet e bllokuara
+                rows = [r for r, c in enumerate(queens) if diag[r + c] > 1 or anti[r - c + n - 1] > 1]
+                rows.extend(r for (r, c) in blocked if 0 <= r < n and queens[r] == c)
+                return rows
+
+            # 2) Riparimi me shkëmbime
+            conflicted = conflicted_rows()
+            for iteration in range(max_iterations):
+                if not conflicted:
+                    break
+                if iteration % n == n - 1:
+                    conflicted = conflicted_rows()
+                    continue
+                k = int(rnd() * len(conflicted))
+                i = conflicted[k]
+                if not conflicts(i):
+                    conflicted[k] = conflicted[-1]
+                    conflicted.pop()
+                    continue
+                j = int(rnd() * n)
+                ci, cj = queens[i], queens[j]
+                if i == j or (i, cj) in blocked or (j, ci) in blocked:
+                    continue
+
+                before = conflicts(i) + conflicts(j)
+                for r, c, delta in ((i, ci, -1), (j, cj, -1), (i, cj, 1), (j, ci, 1)):
+                    diag[r + c] += delta
+                    anti[r - c + n - 1] += delta
+                queens[i], queens[j] = cj, ci
+                if conflicts(i) + conflicts(j) < before:
+                    if conflicts(j):
+                        conflicted.append(j)
+                    continue
+                # Shkëmbimi nuk ndihmoi -> kthehu prapa
+                for r, c, delta in ((i, cj, -1), (j, ci, -1), (i, ci, 1), (j, cj, 1)):
+                    diag[r + c] += delta
+                    anti[r - c + n - 1] += delta
+                queens[i], queens[j] = ci, cj
+
+            if not conflicted_rows():
+                return queens
+
+        return None
+
+    # ---------------------------
+    #   NUMËRIMI I ZGJIDHJEVE
+    # ---------------------------
+    def iter_solutions(self):
+        """Gjenerator që kthen çdo zgjidhje (listë kolonash për secilin rresht) me DFS mbi maska bitësh."""
+        n = self.n
+        full = (1 << n) - 1
+        blocked = self._blocked_row_masks()
+        state = []
+
+        def place(row, cols, ld, rd):
+            if row == n:
+                yield list(state)
+                return
+            available = full & ~(cols | ld | rd | blocked[row])
+            while available:
+                bit = available & -available
+                available ^= bit
+                state.append(bit.bit_length() - 1)
+                yield from place(row + 1, cols | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1)
+                state.pop()
+
+        if n > 0:
+            yield from place(0, 0, 0, 0)
+
+    def _split_tasks(self, split_rows):
+        """
+        Ndan kërkimin sipas zgjedhjeve në rreshtin e parë (dhe opsionalisht të dytë).
+        Pa kuadrate të bllokuara, tabela është simetrike majtas-djathtas: numërohet vetëm
+        gjysma e majtë e rreshtit të parë me peshë 2 (kolona e mesit për n tek me peshë 1).
+        """
+        n = self.n
+        blocked = self._blocked_row_masks()
+        symmetric = not any(blocked)
+        first_row = []
+        for col in range(n):
+            if blocked[0] >> col & 1:
+                continue
+            if symmetric and 2 * col > n - 1:
+                break
+            weight = 2 if symmetric and 2 * col < n - 1 else 1
+            first_row.append(([col], weight))
+
+        if split_rows < 2 or n < 2:
+            return [(n, blocked, prefix, weight) for prefix, weight in first_row]
+
+        tasks = []
+        for prefix, weight in first_row:
+            c0 = prefix[0]
+            for col in range(n):
+                if blocked[1] >> col & 1 or abs(col - c0) <= 1:
+                    continue
+                tasks.append((n, blocked, [c0, col], weight))
+        return tasks
+
+    def count_solutions(self, workers=None, split_rows=1):
+        """
+        Numëron të gjitha vendosjet e vlefshme (jo vetëm të parën si a_star).
+        Puna ndahet sipas kolonave të rreshtit të parë (split_rows=2: edhe të dytit)
+        dhe shpërndahet në një ProcessPoolExecutor; workers=1 e bën numërimin serik.
+        """
+        if self.n <= 0:
+            return 0
+        tasks = self._split_tasks(split_rows)
+        if workers == 1 or len(tasks) <= 1:
+            return sum(map(_count_subtree, tasks))
+
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(_count_subtree, tasks, chunksize=chunksize))
+
 def print_custom_solution(n, solution, blocked_positions):
     """
     Shfaq një tabelë n x n me format:
@@ -1,4 +1,15 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 import chess
+import chess.polyglot
 
 # 1) Vlerat e figurave (mund t’i ndryshoni sipas dëshirës)
 PIECE_VALUES = {
@@ -10,6 +21,282 @@ PIECE_VALUES = {
     chess.KING: 100  # Zakonisht mbretit i jepet një vlerë e lartë, edhe pse loja mbaron nëse kapet mbreti.
 }
 
+# Tabelat e pozicionit (piece-square tables) në centipawn, nga perspektiva e bardhës,
+# të shkruara si tabela vizuale: rreshti i parë është rreshti 8, i fundit rreshti 1.
+PIECE_SQUARE_TABLES = {
+    chess.PAWN: [
+         0,   0,   0,   0,   0,   0,   0,   0,
+        50,  50,  50,  50,  50,  50,  50,  50,
+        10,  10,  20,  30,  30,  20,  10,  10,
+         5,   5,  10,  25,  25,  10,   5,   5,
+         0,   0,   0,  20,  20,   0,   0,   0,
+         5,  -5, -10,   0,   0, -10,  -5,   5,
+         5,  10,  10, -20, -20,  10,  10,   5,
+         0,   0,   0,   0,   0,   0,   0,   0,
+    ],
+    chess.KNIGHT: [
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20,   0,   0,   0,   0, -20, -40,
+        -30,   0,  10,  15,  15,  10,   0, -30,
+        -30,   5,  15,  20,  20,  15,   5, -30,
+        -30,   0,  15,  20,  20,  15,   0, -30,
+        -30,   5,  10,  15,  15,  10,   5, -30,
+        -40, -20,   0,   5,   5,   0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50,
+    ],
+    chess.BISHOP: [
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10,   0,   0,   0,   0,   0,   0, -10,
+        -10,   0,   5,  10,  10,   5,   0, -10,
+        -10,   5,   5,  10,  10,   5,   5, -10,
+        -10,   0,  10,  10,  10,  10,   0, -10,
+        -10,  10,  10,  10,  10,  10,  10, -10,
+        -10,   5,   0,   0,   0,   0,   5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20,
+    ],
+    chess.ROOK: [
+         0,   0,   0,   0,   0,   0,   0,   0,
+         5,  10,  10,  10,  10,  10,  10,   5,
+        -5,   0,   0,   0,   0,   0,   0,  -5,
+        -5,   0,   0,   0,   0,   0,   0,  -5,
+        -5,   0,   0,   0,   0,   0,   0,  -5,
+        -5,   0,   0,   0,   0,   0,   0,  -5,
+        -5,   0,   0,   0,   0,   0,   0,  -5,
+         0,   0,   0,   5,   5,   0,   0,   0,
+    ],
+    chess.QUEEN: [
+        -20, -10, -10,  -5,  -5, -10, -10, -20,
+        -10,   0,   0,   0,   0,   0,   0, -10,
+        -10,   0,   5,   5,   5,   5,   0, -10,
+         -5,   0,   5,   5,   5,   5,   0,  -5,
+          0,   0,   5,   5,   5,   5,   0,  -5,
+        -10,   5,   5,   5,   5,   5,   0, -10,
+        -10,   0,   5,   0,   0,   0,   0, -10,
+        -20, -10, -10,  -5,  -5, -10, -10, -20,
+    ],
+    chess.KING: [
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+         20,  20,   0,   0,   0,   0,  20,  20,
+         20,  30,  10,   0,   0,  10,  30,  20,
+    ],
+}
+
+# Vlera e kombinuar (materiali * 100 + pozicioni) për [ngjyra][figura][katrori], e llogaritur një herë.
+# Për bardhin tabela lexohet me sq ^ 56 (pasqyrim vertikal), për zezin direkt.
+PSQ = {
+    color: {
+        piece_type: [100 * PIECE_VALUES[piece_type] + table[sq ^ 56 if color == chess.WHITE else sq]
+                     for sq in chess.SQUARES]
+        for piece_type, table in PIECE_SQUARE_TABLES.items()
+    }
+    for color in chess.COLORS
+}
+
+# Pesha e një katrori të sulmuar (lëvizshmëria) në centipawn
+MOBILITY_WEIGHT = 5
+
+
+class IncrementalEvaluator:
+    """
+    Vlerësim i shpejtë në centipawn, i mbajtur në mënyrë inkrementale:
+      - materiali + tabelat e pozicionit përditësohen në push/pop vetëm për katroret e prekura
+      - lëvizshmëria llogaritet nga maskat e sulmeve (attacks_mask) të kalorësve, fikëve,
+        torrave dhe mbretëreshave, pa gjeneruar lëvizje të ligjshme
+    Kërkimi duhet të përdorë evaluator.push/pop në vend të board.push/pop.
+    """
+    scale = 100  # njësitë janë centipawn (evaluate_board përdor pion të plotë)
+
+    def __init__(self):
+        self.score = 0  # materiali + pozicioni nga perspektiva e bardhës
+        self.stack = []
+
+    def reset(self, board: chess.Board):
+        """Llogarit vlerën nga e para me popcount dhe skanim të bitboard-eve."""
+        score = 0
+        for color in chess.COLORS:
+            sign = 1 if color == chess.WHITE else -1
+            for piece_type, table in PSQ[color].items():
+                for sq in chess.scan_forward(board.pieces_mask(piece_type, color)):
+                    score += sign * table[sq]
+        self.score = score
+        self.stack = []
+
+    def _delta(self, board: chess.Board, move: chess.Move) -> int:
+        us = board.turn
+        them = not us
+        piece_type = board.piece_type_at(move.from_square)
+        new_type = move.promotion or piece_type
+        delta = PSQ[us][new_type][move.to_square] - PSQ[us][piece_type][move.from_square]
+
+        if board.is_castling(move):
+            rank = 0 if us == chess.WHITE else 56
+            if chess.square_file(move.to_square) > chess.square_file(move.from_square):
+                rook_from, rook_to = rank + 7, rank + 5
+            else:
+                rook_from, rook_to = rank, rank + 3
+            delta += PSQ[us][chess.ROOK][rook_to] - PSQ[us][chess.ROOK][rook_from]
+        elif board.is_en_passant(move):
+            captured_square = move.to_square - 8 if us == chess.WHITE else move.to_square + 8
+            delta += PSQ[them][chess.PAWN][captured_square]
+        else:
+            captured = board.piece_type_at(move.to_square)
+            if captured is not None:
+                delta += PSQ[them][captured][move.to_square]
+
+        return delta if us == chess.WHITE else -delta
+
+    def push(self, board: chess.Board, move: chess.Move):
+        self.stack.append(self.score)
+        self.score += self._delta(board, move)
+        board.push(move)
+
+    def pop(self, board: chess.Board):
+        board.pop()
+        self.score = self.stack.pop()
+
+    def mobility(self, board: chess.Board, color: chess.Color) -> int:
+        own = board.occupied_co[color]
+        total = 0
+        for piece_type in (chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN):
+            for sq in chess.scan_forward(board.pieces_mask(piece_type, color)):
+                total += chess.popcount(board.attacks_mask(sq) & ~own)
+        return total
+
+    def white_score(self, board: chess.Board) -> int:
+        """Vlerësimi statik nga perspektiva e bardhës (pa kontrolluar fundin e lojës)."""
+        mobility = self.mobility(board, chess.WHITE) - self.mobility(board, chess.BLACK)
+        return self.score + MOBILITY_WEIGHT * mobility
+
+    def evaluate(self, board: chess.Board) -> int:
+        """Vlerësimi statik nga perspektiva e lojtarit në radhë, si te evaluate_board."""
+        score = self.white_score(board)
+        return score if board.turn == chess.WHITE else -score
+
+
+class TranspositionTable:
+    """
+    Tabelë transpozimi me madhësi fikse, e indeksuar me hash-in Zobrist të pozicionit.
+    Çdo kovë (bucket) ka dy vende:
+      - vendi 0 zëvendësohet vetëm nga një kërkim me thellësi të njëjtë ose më të madhe (depth-preferred)
+      - vendi 1 zëvendësohet gjithmonë (always-replace)
+    Për secilën hyrje ruhen: thellësia, lloji i kufirit (EXACT/LOWER/UPPER), vlerësimi dhe lëvizja më e mirë.
+    Hyrjet mbahen në array-e të paketuara (jo lista objektesh), që madhësia në MB të përputhet
+    me memorien që zë tabela realisht.
+    """
+    EXACT, LOWER, UPPER = 0, 1, 2
+    # Tipet e array-ve: çelësi 64-bit, thellësia, flag-u, vlerësimi (float, mund të jetë ±inf)
+    # dhe lëvizja e koduar si from + 64*to + (promotion << 12), ku 0 = pa lëvizje
+    KEY_TYPE, DEPTH_TYPE, FLAG_TYPE, SCORE_TYPE, MOVE_TYPE = 'Q', 'h', 'B', 'd', 'H'
+    ENTRY_BYTES = sum(array(code).itemsize for code in (KEY_TYPE, DEPTH_TYPE, FLAG_TYPE, SCORE_TYPE, MOVE_TYPE))
+
+    def __init__(self, size_mb=16):
+        entries = max(2, int(size_mb * 1024 * 1024) // self.ENTRY_BYTES)
+        self.buckets = entries // 2
+        slots = 2 * self.buckets
+        self.keys = array(self.KEY_TYPE, [0]) * slots
+        self.depths = array(self.DEPTH_TYPE, [-1]) * slots
+        self.flags = array(self.FLAG_TYPE, [0]) * slots
+        self.scores = array(self.SCORE_TYPE, [0.0]) * slots
+        self.moves = array(self.MOVE_TYPE, [0]) * slots
+        self.probes = 0
+        self.hits = 0
+
+    @staticmethod
+    def encode_move(move):
+        if move is None:
+            return 0
+        return move.from_square + 64 * move.to_square + ((move.promotion or 0) << 12)
+
+    @staticmethod
+    def decode_move(code):
+        if not code:
+            return None
+        return chess.Move(code & 63, (code >> 6) & 63, (code >> 12) or None)
+
+    def probe(self, key):
+        """Kthen (depth, flag, score, move) për pozicionin ose None nëse nuk gjendet."""
+        self.probes += 1
+        index = 2 * (key % self.buckets)
+        for slot in (index, index + 1):
+            # Thellësia -1 shënon vend bosh (çelësi 0 aty s'është pozicion i ruajtur)
+            if self.keys[slot] == key and self.depths[slot] >= 0:
+                self.hits += 1
+                return self.depths[slot], self.flags[slot], self.scores[slot], self.decode_move(self.moves[slot])
+        return None
+
+    def store(self, key, depth, flag, score, move):
+        index = 2 * (key % self.buckets)
+        slot = index if self.keys[index] == key or depth >= self.depths[index] else index + 1
+        self.keys[slot] = key
+        self.depths[slot] = depth
+        self.flags[slot] = flag
+        self.scores[slot] = score
+        self.moves[slot] = self.encode_move(move)
+
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes else 0.0
+
+    def clear(self):
+        self.__init__(2 * self.buckets * self.ENTRY_BYTES / (1024 * 1024))
+
+
+# Thellësia maksimale (në ply) për të cilën ruhen killer moves
+MAX_PLY = 128
+
+
+class SearchTimeout(Exception):
+    """Ngrihet brenda kërkimit kur mbaron koha e caktuar (deadline)."""
+
+
+class SearchContext:
+    """
+    Gjendja e përbashkët e një kërkimit: tabela e transpozimit, numëruesit dhe afati kohor.
+    Kalohet si parametër opsional te alpha_beta_search dhe find_best_move.
+    """
+    def __init__(self, tt_size_mb=16, fast_eval=False, quiescence=False, qs_max_depth=8, qs_checks=False):
+        self.tt = TranspositionTable(tt_size_mb) if tt_size_mb else None
+        self.nodes = 0
+        # Me fast_eval=True gjethet vlerësohen me IncrementalEvaluator (centipawn) në vend të evaluate_board
+        self.evaluator = IncrementalEvaluator() if fast_eval else None
+        # Quiescence search në gjethe: vetëm kapje (dhe opsionalisht shahe në ply-n e parë)
+        self.quiescence = quiescence
+        self.qs_max_depth = qs_max_depth
+        self.qs_checks = qs_checks
+        self.qnodes = 0
+        self.deadline = None  # time.perf_counter() kur kërkimi duhet të ndalet
+        # Renditja e lëvizjeve: dy "killer moves" për çdo ply dhe tabela e historisë [from * 64 + to]
+        self.move_ordering = True
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = [0] * (64 * 64)
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def first_move_cutoff_rate(self):
+        """Sa përqind e prerjeve ndodhin në lëvizjen e parë të provuar (sa më afër 1, aq më mirë renditja)."""
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def record_cutoff(self, board, move, depth, ply, index):
+        """Përditëson numëruesit, killer moves dhe historinë pas një prerjeje beta/alpha."""
+        self.cutoffs += 1
+        if index == 0:
+            self.first_move_cutoffs += 1
+        if board.is_capture(move) or move.promotion:
+            return
+        killers = self.killers[min(ply, MAX_PLY - 1)]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        self.history[move.from_square * 64 + move.to_square] += depth * depth
+
+
+# Çelësi që i shtohet hash-it kur nyja është e "maksimizuesit", që vlerat e dy roleve të mos përzihen
+MAXIMIZING_KEY = 0x9E3779B97F4A7C15
+
 def evaluate_board(board: chess.Board) -> int:
     """
     Një funksion i thjeshtë vlerësimi:
@@ -51,68 +338,271 @@ def evaluate_board(board: chess.Board) -> int:
     return int(round(total_score))
 
 
-def alpha_beta_search(board: chess.Board, depth: int, alpha: float, beta: float, maximizing_player: bool) -> float:
+def white_score(board: chess.Board) -> int:
+    """Kthen evaluate_board nga perspektiva e bardhës, që vlerat në pemë të jenë të krahasueshme."""
+    score = evaluate_board(board)
+    return score if board.turn == chess.WHITE else -score
+
+
+def push_move(board: chess.Board, move: chess.Move, context: SearchContext = None):
+    """Bën lëvizjen, duke përditësuar edhe vlerësuesin inkremental nëse ka të tillë."""
+    if context is not None and context.evaluator is not None:
+        context.evaluator.push(board, move)
+    else:
+        board.push(move)
+
+
+def pop_move(board: chess.Board, context: SearchContext = None):
+    if context is not None and context.evaluator is not None:
+        context.evaluator.pop(board)
+    else:
+        board.pop()
+
+
+def order_moves(board: chess.Board, moves, hash_move=None, ply: int = 0, context: SearchContext = None):
+    """
+    Rendit lëvizjet që prerjet alpha-beta të ndodhin sa më herët:
+      1) lëvizja nga tabela e transpozimit / variacioni kryesor
+      2) kapjet sipas MVV-LVA (viktima më e vlefshme, sulmuesi më pak i vlefshëm) me PIECE_VALUES
+      3) killer moves të këtij ply-i
+      4) lëvizjet e qeta sipas heuristikës së historisë
+    """
+    killers = context.killers[min(ply, MAX_PLY - 1)] if context is not None else (None, None)
+    history = context.history if context is not None else None
+
+    def score(move):
+        if move == hash_move:
+            return 10_000_000
+        if board.is_capture(move):
+            victim = chess.PAWN if board.is_en_passant(move) else board.piece_type_at(move.to_square)
+            attacker = board.piece_type_at(move.from_square)
+            return 1_000_000 + 100 * PIECE_VALUES[victim] - PIECE_VALUES[attacker]
+        if move.promotion:
+            return 900_000 + PIECE_VALUES[move.promotion]
+        if move == killers[0]:
+            return 800_000
+        if move == killers[1]:
+            return 799_999
+        return history[move.from_square * 64 + move.to_square] if history is not None else 0
+
+    return sorted(moves, key=score, reverse=True)
+
+
+# Margjina e "delta pruning" në pionë: kapja nuk provohet nëse as me këtë shtesë nuk arrin alpha/beta
+DELTA_MARGIN = 2
+
+
+def quiescence_search(board: chess.Board, alpha: float, beta: float, maximizing_player: bool,
+                      context: SearchContext, qdepth: int = 0) -> float:
+    """
+    Vazhdon kërkimin në gjethe vetëm me kapje (dhe promovime), që vlerësimi të mos bëhet
+    në mes të një shkëmbimi figurash (efekti i horizontit).
+      - stand-pat: lojtari mund të mos kapë, prandaj vlerësimi statik është kufi
+      - delta pruning: kapjet që edhe në rastin më të mirë nuk e arrijnë dritaren kapërcehen
+      - në shah nuk ka stand-pat; provohen të gjitha lëvizjet për t'i shpëtuar shahut
+      - me context.qs_checks provohen edhe lëvizjet e qeta që japin shah në ply-n e parë
+    Vlera kthehet nga perspektiva e bardhës, si te alpha_beta_search.
+    """
+    context.qnodes += 1
+    if context.deadline is not None and context.qnodes & 15 == 0 and time.perf_counter() > context.deadline:
+        raise SearchTimeout
+
+    evaluator = context.evaluator
+    scale = evaluator.scale if evaluator is not None else 1
+    in_check = board.is_check()
+
+    if in_check:
+        moves = list(board.legal_moves)
+        if not moves:
+            return -9999 * scale if board.turn == chess.WHITE else 9999 * scale
+        stand_pat = None
+    else:
+        stand_pat = evaluator.white_score(board) if evaluator is not None else white_score(board)
+        if evaluator is None and board.is_game_over():
+            return stand_pat
+        if maximizing_player:
+            if stand_pat >= beta:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+        else:
+            if stand_pat <= alpha:
+                return stand_pat
+            beta = min(beta, stand_pat)
+        if qdepth >= context.qs_max_depth:
+            return stand_pat
+        moves = [move for move in board.generate_legal_moves()
+                 if board.is_capture(move) or move.promotion
+                 or (context.qs_checks and qdepth == 0 and board.gives_check(move))]
+
+    value = stand_pat if stand_pat is not None else (float('-inf') if maximizing_player else float('inf'))
+    for move in order_moves(board, moves):
+        if stand_pat is not None and board.is_capture(move):
+            victim = chess.PAWN if board.is_en_passant(move) else board.piece_type_at(move.to_square)
+            gain = (PIECE_VALUES[victim] + (PIECE_VALUES[move.promotion] - 1 if move.promotion else 0)
+                    + DELTA_MARGIN) * scale
+            if (stand_pat + gain < alpha) if maximizing_player else (stand_pat - gain > beta):
+                continue
+
+        push_move(board, move, context)
+        score = quiescence_search(board, alpha, beta, not maximizing_player, context, qdepth + 1)
+        pop_move(board, context)
+
+        if maximizing_player:
+            value = max(value, score)
+            alpha = max(alpha, value)
+        else:
+            value = min(value, score)
+            beta = min(beta, value)
+        if alpha >= beta:
+            break
+    return value
+
+
+def alpha_beta_search(board: chess.Board, depth: int, alpha: float, beta: float, maximizing_player: bool,
+                      context: SearchContext = None, ply: int = 0) -> float:
     """
     Kryen minimax me prerje alpha-beta:
       - board: tabela aktuale chess.Board
       - depth: thellësia e kërkimit
       - alpha, beta: kufinjtë alpha-beta
       - maximizing_player: True nëse jemi në radhën e “maksimizuesit”, False nëse jemi në radhën e “minimizuesit”
+      - context: opsional, SearchContext me tabelën e transpozimit, renditjen e lëvizjeve dhe numëruesit
+      - ply: largësia nga rrënja (për killer moves)
 
-    Kthen një vlerësim numerik të tabelës.
+    Kthen një vlerësim numerik të tabelës nga perspektiva e bardhës
+    (bardhi është gjithmonë “maksimizuesi”, ndërsa evaluate_board vlerëson nga ana e lojtarit në radhë).
     """
-    # 1) Nëse arrijmë thellësinë 0 ose loja ka mbaruar, vlerësojmë
-    if depth == 0 or board.is_game_over():
-        return evaluate_board(board)
+    # Gjethja i kalon quiescence-it pa u numëruar këtu: ajo numërohet një herë, te context.qnodes
+    if depth == 0 and context is not None and context.quiescence:
+        return quiescence_search(board, alpha, beta, maximizing_player, context)
 
-    legal_moves = list(board.legal_moves)
-    if not legal_moves:
-        # Pa lëvizje të ligjshme => mund të jetë barazim ose mat,
-        # por mund të bëjmë vlerësim edhe këtu
-        return evaluate_board(board)
+    if context is not None:
+        context.nodes += 1
+        # Ora kontrollohet çdo 16 nyje: mjaft shpesh për vonesë të garantuar, pa kushtuar shumë
+        if context.deadline is not None and context.nodes & 15 == 0 and time.perf_counter() > context.deadline:
+            raise SearchTimeout
+
+    evaluator = context.evaluator if context is not None else None
+    if evaluator is not None:
+        # Vlerësuesi i shpejtë: në gjethe nuk gjenerohen lëvizje; mati/pati zbulohen
+        # në nyjet e brendshme kur nuk ka lëvizje të ligjshme.
+        if depth == 0:
+            return evaluator.white_score(board)
+        legal_moves = list(board.legal_moves)
+        if not legal_moves:
+            if board.is_check():
+                return -9999 * evaluator.scale if board.turn == chess.WHITE else 9999 * evaluator.scale
+            return 0
+    else:
+        # 1) Nëse arrijmë thellësinë 0 ose loja ka mbaruar, vlerësojmë
+        if depth == 0 or board.is_game_over():
+            return white_score(board)
+
+        legal_moves = list(board.legal_moves)
+        if not legal_moves:
+            # Pa lëvizje të ligjshme => mund të jetë barazim ose mat,
+            # por mund të bëjmë vlerësim edhe këtu
+            return white_score(board)
 
+    # 2) Tabela e transpozimit: nëse pozicioni është kërkuar tashmë në thellësi të mjaftueshme,
+    #    përdorim rezultatin ose ngushtojmë dritaren; lëvizja e ruajtur provohet e para.
+    tt = context.tt if context is not None else None
+    key = hash_move = None
+    alpha_orig, beta_orig = alpha, beta
+    if tt is not None:
+        key = chess.polyglot.zobrist_hash(board) ^ (MAXIMIZING_KEY if maximizing_player else 0)
+        entry = tt.probe(key)
+        if entry is not None:
+            entry_depth, flag, score, hash_move = entry
+            if entry_depth >= depth:
+                if flag == TranspositionTable.EXACT:
+                    return score
+                if flag == TranspositionTable.LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+    # 3) Renditja e lëvizjeve (vetëm kur kemi kontekst ku ruhen killers/historia)
+    if context is not None and context.move_ordering:
+        legal_moves = order_moves(board, legal_moves, hash_move, ply, context)
+    elif hash_move in legal_moves:
+        legal_moves.remove(hash_move)
+        legal_moves.insert(0, hash_move)
+
+    best_move = None
     if maximizing_player:
         value = float('-inf')
-        for move in legal_moves:
-            board.push(move)
+        for index, move in enumerate(legal_moves):
+            push_move(board, move, context)
             # Pas lëvizjes, radha i kalon kundërshtarit, kështu që “maximizing_player” flip
-            value = max(value, alpha_beta_search(board, depth - 1, alpha, beta, False))
-            board.pop()  # kthe lëvizjen prapa
+            child_value = alpha_beta_search(board, depth - 1, alpha, beta, False, context, ply + 1)
+            pop_move(board, context)  # kthe lëvizjen prapa
+            if child_value > value:
+                value, best_move = child_value, move
 
             alpha = max(alpha, value)
             if alpha >= beta:
                 # Beta cut-off (prerje)
+                if context is not None:
+                    context.record_cutoff(board, move, depth, ply, index)
                 break
-        return value
     else:
         value = float('inf')
-        for move in legal_moves:
-            board.push(move)
+        for index, move in enumerate(legal_moves):
+            push_move(board, move, context)
             # Bëhet radha e kundërshtarit => “maximizing_player” flip
-            value = min(value, alpha_beta_search(board, depth - 1, alpha, beta, True))
-            board.pop()
+            child_value = alpha_beta_search(board, depth - 1, alpha, beta, True, context, ply + 1)
+            pop_move(board, context)
+            if child_value < value:
+                value, best_move = child_value, move
 
             beta = min(beta, value)
             if beta <= alpha:
                 # Alpha cut-off (prerje)
+                if context is not None:
+                    context.record_cutoff(board, move, depth, ply, index)
                 break
-        return value
+
+    if tt is not None:
+        if value <= alpha_orig:
+            flag = TranspositionTable.UPPER
+        elif value >= beta_orig:
+            flag = TranspositionTable.LOWER
+        else:
+            flag = TranspositionTable.EXACT
+        tt.store(key, depth, flag, value, best_move)
+    return value
 
 
-def find_best_move(board: chess.Board, depth: int = 3) -> chess.Move:
+def search_root(board: chess.Board, depth: int, context: SearchContext = None, first_move: chess.Move = None):
     """
-    Duke pasur një tabelë dhe një kufi thellësie,
-    kthen lëvizjen më të mirë sipas minimax me prerjen alpha-beta.
-    (Nga perspektiva e board.turn)
+    Kërkon të gjitha lëvizjet e rrënjës në thellësinë e dhënë dhe kthen (best_move, best_value).
+    Nëse jepet 'first_move' (p.sh. lëvizja më e mirë e iteracionit të kaluar), ajo provohet e para.
     """
     best_move = None
     best_value = float('-inf') if board.turn else float('inf')
 
-    for move in board.legal_moves:
-        board.push(move)
-        # Vlerësojmë pozicionin pas kësaj lëvizjeje
-        value = alpha_beta_search(board, depth - 1, alpha=float('-inf'), beta=float('inf'), maximizing_player=(not board.turn))
-        board.pop()
+    moves = list(board.legal_moves)
+    if context is not None and context.move_ordering:
+        moves = order_moves(board, moves, first_move, 0, context)
+    elif first_move in moves:
+        moves.remove(first_move)
+        moves.insert(0, first_move)
+
+    if context is not None and context.evaluator is not None:
+        context.evaluator.reset(board)
+
+    for move in moves:
+        push_move(board, move, context)
+        # Vlerësojmë pozicionin pas kësaj lëvizjeje. Vlera më e mirë deri tani kalohet si kufi,
+        # që lëvizjet e tjera të rrënjës të priten sapo dihet se nuk e kalojnë atë.
+        alpha = best_value if not board.turn else float('-inf')
+        beta = best_value if board.turn else float('inf')
+        value = alpha_beta_search(board, depth - 1, alpha=alpha, beta=beta,
+                                  maximizing_player=(board.turn == chess.WHITE), context=context, ply=1)
+        pop_move(board, context)
 
         # Nëse është rradha e bardhës, maximizojmë
         if board.turn:  
@@ -124,14 +614,440 @@ def find_best_move(board: chess.Board, depth: int = 3) -> chess.Move:
                 best_value = value
                 best_move = move
 
-    return best_move
+    return best_move, best_value
+
+
+def find_best_move(board: chess.Board, depth: int = 3, context: SearchContext = None) -> chess.Move:
+    """
+    Duke pasur një tabelë dhe një kufi thellësie,
+    kthen lëvizjen më të mirë sipas minimax me prerjen alpha-beta.
+    (Nga perspektiva e board.turn)
+    Me një SearchContext, kërkimi përdor tabelën e transpozimit dhe numëron nyjet.
+    """
+    return search_root(board, depth, context)[0]
+
+
+def find_best_move_timed(board: chess.Board, time_limit: float, max_depth: int = 64,
+                         context: SearchContext = None, verbose: bool = False):
+    """
+    Iterative deepening me kufi kohor: kërkon në thellësi 1, 2, 3, ... derisa të mbarojë koha.
+      - Rezultati merret gjithmonë nga iteracioni i fundit i përfunduar.
+      - Lëvizja më e mirë e iteracionit të kaluar (variacioni kryesor) provohet e para.
+      - Kur mbaron koha, kërkimi ndalet menjëherë dhe tabela kthehet në gjendjen fillestare.
+
+    Kthen (best_move, iterations), ku iterations është listë fjalorësh me
+    'depth', 'move', 'score', 'nodes', 'nps' dhe 'elapsed' për secilin iteracion të përfunduar.
+    """
+    started = time.perf_counter()
+    if context is None:
+        context = SearchContext(tt_size_mb=TT_SIZE_MB)
+
+    legal_moves = list(board.legal_moves)
+    if not legal_moves:
+        return None, []
+
+    context.deadline = started + time_limit
+    stack_size = len(board.move_stack)
+    best_move = legal_moves[0]  # Rezervë nëse as thellësia 1 nuk përfundon
+    iterations = []
+
+    try:
+        for depth in range(1, max_depth + 1):
+            nodes_before = context.nodes + context.qnodes
+            iteration_start = time.perf_counter()
+            move, score = search_root(board, depth, context, first_move=best_move)
+            now = time.perf_counter()
+
+            best_move = move
+            nodes = context.nodes + context.qnodes - nodes_before
+            elapsed = now - iteration_start
+            iterations.append({
+                'depth': depth,
+                'move': move.uci(),
+                'score': score,
+                'nodes': nodes,
+                'nps': int(nodes / elapsed) if elapsed > 0 else 0,
+                'elapsed': round(now - started, 4),
+            })
+            if verbose:
+                info = iterations[-1]
+                print(f"thellësia {depth}: {info['move']} vlera={score} nyje={nodes} "
+                      f"nps={info['nps']} koha={info['elapsed']:.2f}s")
+            # Nëse iteracioni tjetër me siguri nuk përfundon, nuk e fillojmë fare
+            if now - started + 2 * elapsed > time_limit:
+                break
+    except SearchTimeout:
+        while len(board.move_stack) > stack_size:
+            board.pop()
+    finally:
+        context.deadline = None
+
+    return best_move, iterations
+
+
+# Kufiri i përbashkët (alpha për bardhin, beta për zezin) mes proceseve në mënyrën jo-deterministe
+_shared_bound = None
+
+
+def _init_root_worker(shared_bound):
+    global _shared_bound
+    _shared_bound = shared_bound
+
+
+def _search_root_move(task):
+    """
+    Punëtori i kërkimit paralel: merr pozicionin si FEN, bën një lëvizje të rrënjës
+    dhe e kërkon me dritaren që fillon nga kufiri i dhënë. Kthen (uci, vlera, nyjet, kufiri),
+    ku 'kufiri' është ai që u përdor realisht (mund të jetë më i ngushtë se i dhëni).
+    """
+    fen, move_uci, depth, bound, options, deterministic = task
+    board = chess.Board(fen)
+    white_root = board.turn == chess.WHITE
+    if not deterministic and _shared_bound is not None:
+        # Marrim kufirin më të mirë të njohur nga punëtorët e tjerë
+        shared = _shared_bound.value
+        bound = max(bound, shared) if white_root else min(bound, shared)
+
+    context = SearchContext(**options)
+    if context.evaluator is not None:
+        context.evaluator.reset(board)
+    push_move(board, chess.Move.from_uci(move_uci), context)
+    alpha = bound if white_root else float('-inf')
+    beta = bound if not white_root else float('inf')
+    value = alpha_beta_search(board, depth - 1, alpha, beta, board.turn == chess.WHITE, context, ply=1)
+
+    if not deterministic and _shared_bound is not None:
+        with _shared_bound.get_lock():
+            if (value > _shared_bound.value) if white_root else (value < _shared_bound.value):
+                _shared_bound.value = value
+    return move_uci, value, context.nodes + context.qnodes, bound
+
+
+def find_best_move_parallel(board: chess.Board, depth: int = 4, workers: int = None,
+                            deterministic: bool = True, options: dict = None):
+    """
+    Kërkim paralel i rrënjës në stilin "young brothers wait":
+      1) lëvizja e parë (pas renditjes) kërkohet serikisht dhe jep kufirin fillestar
+      2) lëvizjet e tjera shpërndahen në procese punëtore, secili merr pozicionin si FEN
+         dhe kërkon me dritaren e ngushtuar nga ai kufi
+    Me deterministic=True kufiri nuk ndryshon gjatë kërkimit paralel, kështu që rezultati
+    është gjithmonë i njëjtë; përndryshe punëtorët ndajnë kufirin më të mirë përmes një
+    multiprocessing.Value.
+
+    Kthen (best_move, best_value, nodes).
+    """
+    options = dict(options or {'tt_size_mb': 16})
+    moves = list(board.legal_moves)
+    if not moves:
+        return None, None, 0
+    moves = order_moves(board, moves)
+    white_root = board.turn == chess.WHITE
+    fen = board.fen()
+
+    # 1) Vëllai i madh: lëvizja e parë serikisht
+    first_uci, best_value, nodes, _ = _search_root_move((fen, moves[0].uci(), depth,
+                                                      float('-inf') if white_root else float('inf'),
+                                                      options, True))
+    best_move = moves[0]
+    if len(moves) == 1:
+        return best_move, best_value, nodes
+
+    # 2) Vëllezërit e vegjël: paralelisht me kufirin e lëvizjes së parë
+    tasks = [(fen, move.uci(), depth, best_value, options, deterministic) for move in moves[1:]]
+    shared_bound = multiprocessing.Value('d', best_value)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_root_worker,
+                             initargs=(shared_bound,)) as executor:
+        results = list(executor.map(_search_root_move, tasks))
+
+    # Rezultatet shqyrtohen në renditjen e lëvizjeve, që barazimet të zgjidhen gjithmonë njësoj.
+    # Një vlerë që nuk e kalon kufirin e përdorur nga punëtori është vetëm kufi (fail-low),
+    # jo vlerë e saktë, prandaj lëvizja nuk konsiderohet më e mirë.
+    for move_uci, value, move_nodes, used_bound in results:
+        nodes += move_nodes
+        if white_root:
+            better = value > used_bound and value > best_value
+        else:
+            better = value < used_bound and value < best_value
+        if better:
+            best_value, best_move = value, chess.Move.from_uci(move_uci)
+    return best_move, best_value, nodes
+
+
+def compare_parallel_speedup(fen: str = None, depth: int = 4, workers: int = None, options: dict = None):
+    """Mat shpejtimin e find_best_move_parallel kundrejt kërkimit serik në të njëjtin pozicion."""
+    board = chess.Board(fen or SAMPLE_FEN)
+    options = dict(options or {'tt_size_mb': 16})
+
+    started = time.perf_counter()
+    context = SearchContext(**options)
+    serial_move = find_best_move(board, depth, context)
+    serial_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parallel_move, _, parallel_nodes = find_best_move_parallel(board, depth, workers, True, options)
+    parallel_time = time.perf_counter() - started
+
+    return {
+        'depth': depth,
+        'workers': workers or os.cpu_count(),
+        'serial_move': serial_move.uci() if serial_move else None,
+        'serial_nodes': context.nodes + context.qnodes,
+        'serial_time': round(serial_time, 3),
+        'parallel_move': parallel_move.uci() if parallel_move else None,
+        'parallel_nodes': parallel_nodes,
+        'parallel_time': round(parallel_time, 3),
+        'speedup': round(serial_time / parallel_time, 2) if parallel_time > 0 else None,
+    }
+
+
+def parse_position(line: str):
+    """
+    Lexon një rresht FEN ose EPD. Kthen (board, id) ku 'id' është operacioni "id" i EPD-së (ose None).
+    """
+    fields = line.split()
+    if len(fields) >= 6 and fields[4].isdigit() and fields[5].isdigit():
+        return chess.Board(" ".join(fields[:6])), None
+    board, operations = chess.Board.from_epd(line)
+    return board, operations.get("id")
+
+
+def analyze_position(task):
+    """
+    Punëtori i analizës batch: (indeksi, rreshti, thellësia, koha, opsionet) -> fjalor për JSON.
+    Me 'time_limit' përdoret find_best_move_timed, përndryshe find_best_move me thellësi fikse.
+    """
+    index, line, depth, time_limit, options = task
+    result = {'index': index}
+    try:
+        board, position_id = parse_position(line)
+    except ValueError as error:
+        result['error'] = str(error)
+        return result
+    if position_id is not None:
+        result['id'] = position_id
+    result['fen'] = board.fen()
+
+    context = SearchContext(**options)
+    started = time.perf_counter()
+    if time_limit is not None:
+        move, iterations = find_best_move_timed(board, time_limit, context=context)
+        score = iterations[-1]['score'] if iterations else None
+        result['depth'] = iterations[-1]['depth'] if iterations else 0
+    else:
+        move, score = search_root(board, depth, context)
+        result['depth'] = depth
+    result['best_move'] = move.uci() if move is not None else None
+    result['score'] = score if score not in (float('inf'), float('-inf')) else None
+    result['nodes'] = context.nodes + context.qnodes
+    result['time'] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def _read_positions(source, start_offset, start_index):
+    """Lexon rreshtat si rrjedhë (bytes) dhe kthen (indeksi, offset-i pas rreshtit, rreshti)."""
+    offset, index = start_offset, start_index
+    for raw in source:
+        offset += len(raw)
+        line = raw.decode("utf-8", errors="replace").strip()
+        if not line or line.startswith("#"):
+            continue
+        yield index, offset, line
+        index += 1
+
+
+def analyze_file(input_path: str, output_path: str, depth: int = 3, time_limit: float = None,
+                 workers: int = None, options: dict = None, resume: bool = True,
+                 checkpoint_every: int = 100):
+    """
+    Analizon një skedar EPD/FEN (një pozicion për rresht) pa e ngarkuar të gjithin në memorie.
+    Pozicionet shpërndahen në një ProcessPoolExecutor dhe rezultatet shkruhen si JSON lines
+    në renditjen e hyrjes: indeksi, lëvizja më e mirë, vlera, nyjet dhe koha.
+
+    Pas çdo 'checkpoint_every' rezultatesh ruhet një checkpoint (output_path + ".ckpt")
+    me offset-in në hyrje dhe madhësinë e daljes. Me resume=True analiza vazhdon nga aty
+    pas një ndërprerjeje, duke prerë daljen te pjesa e konfirmuar. Nëse dalja mungon ose
+    është më e shkurtër se ç'thotë checkpoint-i, analiza nis nga fillimi.
+
+    Kthen numrin e pozicioneve të analizuara në këtë ekzekutim.
+    """
+    options = dict(options or {'tt_size_mb': 16})
+    checkpoint_path = output_path + ".ckpt"
+    start_offset, start_index, output_size = 0, 0, 0
+    if resume and os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as ckpt:
+            state = json.load(ckpt)
+        start_offset, start_index, output_size = state['offset'], state['index'], state['output_size']
+        if not os.path.exists(output_path) or os.path.getsize(output_path) < output_size:
+            # Checkpoint-i nuk përputhet me daljen: rezultatet e konfirmuara kanë humbur
+            start_offset, start_index, output_size = 0, 0, 0
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = 4 * workers
+    analyzed = 0
+
+    mode = "r+" if start_offset else "w"
+    with open(input_path, "rb") as source, open(output_path, mode) as out, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        if mode == "r+":
+            out.seek(output_size)
+            out.truncate()
+        source.seek(start_offset)
+
+        def save_checkpoint(offset, index):
+            out.flush()
+            os.fsync(out.fileno())
+            temporary = checkpoint_path + ".tmp"
+            with open(temporary, "w") as ckpt:
+                json.dump({'offset': offset, 'index': index, 'output_size': out.tell()}, ckpt)
+            os.replace(temporary, checkpoint_path)
+
+        pending = deque()
+        last = None
+
+        def write_next():
+            nonlocal analyzed, last
+            index, offset, future = pending.popleft()
+            out.write(json.dumps(future.result()) + "\n")
+            analyzed += 1
+            last = (offset, index + 1)
+            if analyzed % checkpoint_every == 0:
+                save_checkpoint(*last)
+
+        for index, offset, line in _read_positions(source, start_offset, start_index):
+            future = executor.submit(analyze_position, (index, line, depth, time_limit, options))
+            pending.append((index, offset, future))
+            if len(pending) >= max_pending:
+                write_next()
+        while pending:
+            write_next()
+        if last is not None:
+            save_checkpoint(*last)
+
+    return analyzed
+
+
+# Madhësia e tabelës së transpozimit në MB
+TT_SIZE_MB = 64
+
+# Pozicioni shembull "mid-game" që përdoret nga main() dhe matjet (radha e bardhës)
+SAMPLE_FEN = "r1bq1rk1/pppp1ppp/2n2n2/1Bb1p3/2B5/2N2N2/PPPP1PPP/R1BQ1RK1 w - - 0 1"
+
+# Pozicionet e matjeve: (emri, FEN, thellësia e perft, numri i pritur i nyjeve të perft-it).
+# Për pozicionet standarde numrat e pritur janë vlerat e publikuara (chessprogramming.org/Perft_Results);
+# për SAMPLE_FEN është vlera e matur me python-chess.
+BENCHMARK_POSITIONS = [
+    ("sample", SAMPLE_FEN, 3, 37280),
+    ("startpos", chess.STARTING_FEN, 3, 8902),
+    ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", 2, 2039),
+    ("position3", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 3, 2812),
+    ("position4", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", 2, 264),
+    ("position5", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", 2, 1486),
+]
+
+
+def perft(board: chess.Board, depth: int) -> int:
+    """Numëron nyjet gjethe të pemës së lëvizjeve të ligjshme deri në 'depth' (kontroll korrektësie)."""
+    if depth == 0:
+        return 1
+    moves = list(board.legal_moves)
+    if depth == 1:
+        return len(moves)
+    total = 0
+    for move in moves:
+        board.push(move)
+        total += perft(board, depth - 1)
+        board.pop()
+    return total
+
+
+def run_benchmark(depth: int = 4, options: dict = None, positions=None) -> dict:
+    """
+    Ekzekuton perft dhe kërkimin me thellësi fikse në secilin pozicion të matjeve.
+    Kthen një fjalor që mund të ruhet si JSON: për çdo pozicion numri i perft-it (dhe nëse përputhet
+    me vlerën e pritur), nyjet e kërkimit, NPS, goditjet në TT dhe koha; plus totalet.
+    """
+    options = dict(options or {'tt_size_mb': 16})
+    results = []
+    total_nodes, total_time, perft_ok = 0, 0.0, True
+    for name, fen, perft_depth, expected in positions or BENCHMARK_POSITIONS:
+        board = chess.Board(fen)
+        started = time.perf_counter()
+        count = perft(board, perft_depth)
+        perft_time = time.perf_counter() - started
+
+        context = SearchContext(**options)
+        started = time.perf_counter()
+        move, score = search_root(board, depth, context)
+        elapsed = time.perf_counter() - started
+        nodes = context.nodes + context.qnodes
+
+        ok = expected is None or count == expected
+        perft_ok = perft_ok and ok
+        total_nodes += nodes
+        total_time += elapsed
+        results.append({
+            'name': name,
+            'fen': fen,
+            'perft_depth': perft_depth,
+            'perft': count,
+            'perft_expected': expected,
+            'perft_ok': ok,
+            'perft_time': round(perft_time, 4),
+            'depth': depth,
+            'best_move': move.uci() if move is not None else None,
+            'score': score if score not in (float('inf'), float('-inf')) else None,
+            'nodes': nodes,
+            'qnodes': context.qnodes,
+            'nps': round(nodes / elapsed) if elapsed else 0,
+            'tt_hit_rate': round(context.tt.hit_rate(), 4) if context.tt else None,
+            'time': round(elapsed, 4),
+        })
+    return {
+        'depth': depth,
+        'options': options,
+        'positions': results,
+        'perft_ok': perft_ok,
+        'total_nodes': total_nodes,
+        'total_time': round(total_time, 4),
+        'nps': round(total_nodes / total_time) if total_time else 0,
+    }
+
+
+def compare_benchmark(current: dict, baseline: dict, tolerance: float = 0.10):
+    """
+    Krahason rezultatin e matjes me një bazë (baseline) të ruajtur më parë.
+    Kthen (regresionet, ndryshimet): regresion është perft i gabuar, rritje e nyjeve
+    ose rënie e NPS-it përtej 'tolerance'; ndryshimet janë p.sh. lëvizje tjetër më e mirë.
+    """
+    regressions, changes = [], []
+    if not current['perft_ok']:
+        regressions.append("perft nuk përputhet me vlerat e pritura")
+    if current['depth'] != baseline.get('depth'):
+        changes.append(f"thellësi e ndryshme: {baseline.get('depth')} -> {current['depth']}")
+    if current['options'] != baseline.get('options'):
+        changes.append(f"opsione të ndryshme: {baseline.get('options')} -> {current['options']}")
+    previous = {entry['name']: entry for entry in baseline.get('positions', [])}
+    for entry in current['positions']:
+        old = previous.get(entry['name'])
+        if old is None:
+            changes.append(f"{entry['name']}: pozicion i ri (pa bazë)")
+            continue
+        if old['nodes'] and entry['nodes'] > old['nodes'] * (1 + tolerance):
+            regressions.append(f"{entry['name']}: nyjet {old['nodes']} -> {entry['nodes']}")
+        elif entry['nodes'] != old['nodes']:
+            changes.append(f"{entry['name']}: nyjet {old['nodes']} -> {entry['nodes']}")
+        if entry['best_move'] != old['best_move']:
+            changes.append(f"{entry['name']}: lëvizja {old['best_move']} -> {entry['best_move']}")
+    if baseline.get('nps') and current['nps'] < baseline['nps'] * (1 - tolerance):
+        regressions.append(f"NPS {baseline['nps']} -> {current['nps']}")
+    return regressions, changes
 
 
 def main():
     # Mund të vendosni një FEN kustom që përfaqëson një pozicion “mid-game”.
     # Më poshtë një shembull i një pozicioni rastësor (s’është domosdoshmërisht i balancuar).
     # (Këtu është radha e bardhës.)
-    fen = "r1bq1rk1/pppp1ppp/2n2n2/1Bb1p3/2B5/2N2N2/PPPP1PPP/R1BQ1RK1 w - - 0 1"
+    fen = SAMPLE_FEN
     board = chess.Board(fen)
 
     print("Tabela fillestare (FEN):")
@@ -139,7 +1055,10 @@ def main():
     print("Radha e tabelës:", "Bardhë" if board.turn else "Zezë")
 
     search_depth = int(input("Thellësia e kërkimit: "))
-    best = find_best_move(board, depth=search_depth)
+    context = SearchContext(tt_size_mb=TT_SIZE_MB)
+    best = find_best_move(board, depth=search_depth, context=context)
+    print(f"Nyje: {context.nodes + context.qnodes}, goditje në tabelën e transpozimit: {context.tt.hit_rate():.1%}, "
+          f"prerje në lëvizjen e parë: {context.first_move_cutoff_rate():.1%}")
 
     print(f"\nLëvizja më e mirë e sugjeruar nga MiniMax me alpha-beta (thellësi={search_depth}):", best)
     if best is not None:
@@ -149,5 +1068,68 @@ def main():
     else:
         print("S’ka lëvizje të ligjshme ose s’ka lëvizje më të mirë.")
 
+def cli(argv):
+    """Komandat shtesë nga rreshti i komandës (pa argumente hapet main() interaktiv)."""
+    parser = argparse.ArgumentParser(prog="Chess-MinMax.py")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parallel = commands.add_parser("parallel", help="krahason kërkimin paralel me atë serik në SAMPLE_FEN")
+    parallel.add_argument("depth", type=int, nargs="?", default=4)
+    parallel.add_argument("workers", type=int, nargs="?", default=None)
+
+    batch = commands.add_parser("batch", help="analizon një skedar EPD/FEN dhe shkruan JSON lines")
+    batch.add_argument("input")
+    batch.add_argument("output")
+    batch.add_argument("--depth", type=int, default=3)
+    batch.add_argument("--time", type=float, default=None, help="sekonda për pozicion (iterative deepening)")
+    batch.add_argument("--workers", type=int, default=None)
+    batch.add_argument("--fast-eval", action="store_true")
+    batch.add_argument("--quiescence", action="store_true")
+    batch.add_argument("--no-resume", action="store_true")
+
+    bench = commands.add_parser("bench", help="perft dhe kërkim me thellësi fikse në pozicionet e matjeve (JSON)")
+    bench.add_argument("--depth", type=int, default=4)
+    bench.add_argument("--output", help="ruan rezultatin JSON në këtë skedar")
+    bench.add_argument("--baseline", help="skedar JSON i një matjeje të mëparshme për krahasim")
+    bench.add_argument("--tolerance", type=float, default=0.10)
+    bench.add_argument("--fast-eval", action="store_true")
+    bench.add_argument("--quiescence", action="store_true")
+
+    args = parser.parse_args(argv)
+    if args.command == "parallel":
+        result = compare_parallel_speedup(depth=args.depth, workers=args.workers)
+        for key, value in result.items():
+            print(f"{key}: {value}")
+    elif args.command == "batch":
+        options = {'tt_size_mb': 16, 'fast_eval': args.fast_eval, 'quiescence': args.quiescence}
+        started = time.perf_counter()
+        count = analyze_file(args.input, args.output, depth=args.depth, time_limit=args.time,
+                             workers=args.workers, options=options, resume=not args.no_resume)
+        print(f"U analizuan {count} pozicione për {time.perf_counter() - started:.2f} s")
+    elif args.command == "bench":
+        options = {'tt_size_mb': 16, 'fast_eval': args.fast_eval, 'quiescence': args.quiescence}
+        result = run_benchmark(depth=args.depth, options=options)
+        report = json.dumps(result, indent=2)
+        if args.output:
+            with open(args.output, "w") as out:
+                out.write(report + "\n")
+        else:
+            print(report)
+        if args.baseline:
+            with open(args.baseline) as source:
+                regressions, changes = compare_benchmark(result, json.load(source), args.tolerance)
+            for line in changes:
+                print("ndryshim:", line, file=sys.stderr)
+            for line in regressions:
+                print("REGRESION:", line, file=sys.stderr)
+            if regressions:
+                sys.exit(1)
+        elif not result['perft_ok']:
+            print("REGRESION: perft nuk përputhet me vlerat e pritura", file=sys.stderr)
+            sys.exit(1)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        cli(sys.argv[1:])
+    else:
+        main()
\ No newline at end of file
@@ -1,6 +1,66 @@
+import random
+import sys
+import time
+from itertools import combinations, permutations
+
 from ortools.sat.python import cp_model
 
-def solve_killer_sudoku():
+# Tabela e kombinimeve të kafazeve, e ndërtuar një herë: (madhësia, shuma) -> lista e seteve
+# të shifrave të ndryshme 1..9 me atë madhësi dhe shumë (511 nënbashkësi jo bosh gjithsej).
+CAGE_COMBINATIONS = {}
+for _size in range(1, 10):
+    for _digits in combinations(range(1, 10), _size):
+        CAGE_COMBINATIONS.setdefault((_size, sum(_digits)), []).append(_digits)
+
+# Kafazet deri në këtë numër permutacionesh kufizohen edhe me AddAllowedAssignments;
+# për kafazet më të mëdha tabelat e gjata e ngadalësojnë solver-in, prandaj mjafton
+# reduktimi i domain-it të qelizave.
+MAX_ALLOWED_TUPLES = 24
+
+
+def cage_combinations(size, total):
+    """Kthen kombinimet e shifrave të ndryshme për një kafaz (listë bosh nëse kafazi është i pamundur)."""
+    return CAGE_COMBINATIONS.get((size, total), [])
+
+
+def impossible_cages(cages):
+    """Kthen indekset e kafazeve që s'kanë asnjë kombinim të vlefshëm (zbulohen para zgjidhjes)."""
+    return [index for index, cage in enumerate(cages)
+            if not cage_combinations(len(cage['cells']), cage['sum'])]
+
+
+# Definojmë secilin kafaz nga:
+#  - 'sum': shuma e synuar
+#  - 'cells': lista e çifteve (row, col) që i përkasin atij kafazi
+#
+# Këtu janë disa kafaze shembull. Zëvendësoni me kafazet reale
+# të enigmës suaj, ku çdo qelizë e tabelës 9x9 mbulohet nga një kafaz.
+EXAMPLE_CAGES = [
+    # Shembull i kafazit 1
+    {'sum': 15, 'cells': [(0, 0), (0, 1), (1, 0)]},
+    # Shembull i kafazit 2
+    {'sum': 9,  'cells': [(0, 2), (1, 2)]},
+    # Shembull i kafazit 3
+    {'sum': 10, 'cells': [(2, 0), (2, 1), (3, 0)]},
+    # ...
+    # Këtu shtoni kafazet e tjera sipas nevojës
+]
+
+
+def solve_killer_sudoku(cages=None, use_combinations=True, time_limit=None):
+    """
+    Zgjidh një Killer Sudoku me CP-SAT.
+    Me use_combinations=True çdo kafaz merr nga tabela CAGE_COMBINATIONS:
+      - domain-in e qelizave të kufizuar në shifrat që shfaqen në ndonjë kombinim
+      - AddAllowedAssignments me të gjitha permutacionet, kur ato janë të pakta
+    dhe kafazet e pamundura zbulohen pa thirrur solver-in.
+    Kthen (status, grid ose None, koha e zgjidhjes në sekonda).
+    """
+    if cages is None:
+        cages = EXAMPLE_CAGES
+    if use_combinations and impossible_cages(cages):
+        return cp_model.INFEASIBLE, None, 0.0
+
     model = cp_model.CpModel()
 
     # Do të krijojmë një matricë 9x9 të tipit IntVar, secila në [1..9].
@@ -31,24 +91,6 @@ def solve_killer_sudoku():
     #
     # 2) “Killer Sudoku” - kafazet
     #
-    # Definojmë secilin kafaz nga:
-    #  - 'sum': shuma e synuar
-    #  - 'cells': lista e çifteve (row, col) që i përkasin atij kafazi
-    #
-    # Këtu janë disa kafaze shembull. Zëvendësoni me kafazet reale 
-    # të enigmës suaj, ku çdo qelizë e tabelës 9x9 mbulohet nga një kafaz.
-    cages = [
-        # Shembull i kafazit 1
-        {'sum': 15, 'cells': [(0, 0), (0, 1), (1, 0)]},
-        # Shembull i kafazit 2
-        {'sum': 9,  'cells': [(0, 2), (1, 2)]},
-        # Shembull i kafazit 3
-        {'sum': 10, 'cells': [(2, 0), (2, 1), (3, 0)]},
-        # ...
-        # Këtu shtoni kafazet e tjera sipas nevojës
-    ]
-
-    # Shtojmë kufizimet për çdo kafaz
     for cage in cages:
         cage_cells = []
         for (r, c) in cage['cells']:
@@ -57,6 +99,17 @@ def solve_killer_sudoku():
         model.Add(sum(cage_cells) == cage['sum'])
         # (b) Të gjitha shifrat brenda një kafazi duhet të jenë të ndryshme
         model.AddAllDifferent(cage_cells)
+        if use_combinations:
+            # (c) Vetëm shifrat e kombinimeve të mundshme, ose drejtpërdrejt permutacionet e tyre
+            options = cage_combinations(len(cage_cells), cage['sum'])
+            digits = sorted(set(d for option in options for d in option))
+            for cell in cage_cells:
+                model.AddLinearExpressionInDomain(cell, cp_model.Domain.FromValues(digits))
+            n_tuples = len(options)
+            for k in range(2, len(cage_cells) + 1):
+                n_tuples *= k
+            if 1 < len(cage_cells) and n_tuples <= MAX_ALLOWED_TUPLES:
+                model.AddAllowedAssignments(cage_cells, [p for option in options for p in permutations(option)])
 
     # 3) Opsionale: Nëse kemi ndonjë numër të dhënë paraprakisht, shtojmë si kufizim:
     #   model.Add(X[row][col] == value)
@@ -65,19 +118,90 @@ def solve_killer_sudoku():
 
     # 4) Zgjidhja e modelit
     solver = cp_model.CpSolver()
+    if time_limit is not None:
+        solver.parameters.max_time_in_seconds = time_limit
+    started = time.perf_counter()
     status = solver.Solve(model)
+    elapsed = time.perf_counter() - started
 
     if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+        return status, [[solver.Value(X[r][c]) for c in range(9)] for r in range(9)], elapsed
+    return status, None, elapsed
+
+
+def random_solution_grid(rng):
+    """Një tabelë Sudoku e plotë: modeli bazë (r*3 + r//3 + c) % 9 me rreshta, kolona dhe shifra të përziera."""
+    def shuffled_axis():
+        bands = rng.sample(range(3), 3)
+        return [band * 3 + inner for band in bands for inner in rng.sample(range(3), 3)]
+    rows, cols = shuffled_axis(), shuffled_axis()
+    digits = rng.sample(range(1, 10), 9)
+    return [[digits[(r * 3 + r // 3 + c) % 9] for c in cols] for r in rows]
+
+
+def random_killer_puzzle(seed, max_cage_size=5):
+    """
+    Ndërton një enigmë Killer Sudoku nga një tabelë e plotë: qelizat ndahen në kafaze të lidhura
+    (pa shifra të përsëritura brenda kafazit) dhe shuma e secilit merret nga zgjidhja.
+    Kthen (cages, solution).
+    """
+    rng = random.Random(seed)
+    solution = random_solution_grid(rng)
+    unassigned = set((r, c) for r in range(9) for c in range(9))
+    cages = []
+    while unassigned:
+        start = min(unassigned)
+        cells, digits = [start], {solution[start[0]][start[1]]}
+        unassigned.discard(start)
+        target = rng.randint(1, max_cage_size)
+        while len(cells) < target:
+            frontier = [(r + dr, c + dc) for r, c in cells for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0))
+                        if (r + dr, c + dc) in unassigned and solution[r + dr][c + dc] not in digits]
+            if not frontier:
+                break
+            cell = rng.choice(frontier)
+            cells.append(cell)
+            digits.add(solution[cell[0]][cell[1]])
+            unassigned.discard(cell)
+        cages.append({'sum': sum(solution[r][c] for r, c in cells), 'cells': cells})
+    return cages, solution
+
+
+def benchmark(n_puzzles=20, seed=0, time_limit=60.0, max_cage_size=6):
+    """
+    Krahason kohën e zgjidhjes me dhe pa tabelën e kombinimeve në të njëjtat enigma.
+    Kthen fjalor me kohët totale të zgjidhjes dhe reduktimin (si pjesë e kohës pa tabelë).
+    """
+    totals = {'plain': 0.0, 'combinations': 0.0}
+    for index in range(n_puzzles):
+        cages, _ = random_killer_puzzle(seed + index, max_cage_size)
+        for name, use_combinations in (('plain', False), ('combinations', True)):
+            status, grid, elapsed = solve_killer_sudoku(cages, use_combinations, time_limit)
+            if grid is None:
+                raise RuntimeError(f"enigma {seed + index} nuk u zgjidh ({name})")
+            totals[name] += elapsed
+    return {
+        'puzzles': n_puzzles,
+        'plain': round(totals['plain'], 3),
+        'combinations': round(totals['combinations'], 3),
+        'reduction': round(1 - totals['combinations'] / totals['plain'], 3) if totals['plain'] else 0.0,
+    }
+
+
+def main():
+    status, grid, _ = solve_killer_sudoku()
+    if grid is not None:
         print("U gjet një zgjidhje:")
         # Shtypim tabelën
-        for r in range(9):
-            row_values = []
-            for c in range(9):
-                val = solver.Value(X[r][c])
-                row_values.append(str(val))
-            print(" ".join(row_values))
+        for row in grid:
+            print(" ".join(str(val) for val in row))
     else:
         print("S’ka zgjidhje.")
 
 if __name__ == "__main__":
-    solve_killer_sudoku()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        n_puzzles = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+        for key, value in benchmark(n_puzzles).items():
+            print(f"{key}: {value}")
+    else:
+        main()
\ No newline at end of file
@@ -1,27 +1,91 @@
+import csv
+import json
+import sys
+import time
+from array import array
+
 from ortools.sat.python import cp_model
-from itertools import product, groupby
 
-def groupby_keys(input_list, keylist):
+
+class DisjointSets:
+    """Union-find (union by size, path halving) mbi mysafirët 0..n-1; mund të rritet me add()."""
+    def __init__(self, n=0):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def add(self):
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        return len(self.parent) - 1
+
+    def find(self, g):
+        parent = self.parent
+        while parent[g] != g:
+            parent[g] = parent[parent[g]]
+            g = parent[g]
+        return g
+
+    def union(self, i, j):
+        """Bashkon grupet e i dhe j; kthen madhësinë e grupit të bashkuar."""
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            if self.size[ri] < self.size[rj]:
+                ri, rj = rj, ri
+            self.parent[rj] = ri
+            self.size[ri] += self.size[rj]
+        return self.size[ri]
+
+    def clusters(self):
+        """Kthen (cluster_of, clusters): cluster_of[guest] = indeksi i grupit, clusters = lista e anëtarëve."""
+        cluster_of = [0] * len(self.parent)
+        index_of_root = {}
+        clusters = []
+        for g in range(len(self.parent)):
+            root = self.find(g)
+            if root not in index_of_root:
+                index_of_root[root] = len(clusters)
+                clusters.append([])
+            cluster_of[g] = index_of_root[root]
+            clusters[cluster_of[g]].append(g)
+        return cluster_of, clusters
+
+
+def cluster_guests(n_guests, must_pairs):
     """
-    Funksion ndihmës për të grupuar elementet në 'input_list'
-    sipas vlerave të çelësave të specifikuar në 'keylist'.
+    Bashkon mysafirët që duhet të ulen bashkë (must_pairs) me union-find (union by size).
+    Kthen (cluster_of, clusters): cluster_of[guest] = indeksi i grupit, clusters = lista e anëtarëve.
     """
-    keyfunc = lambda x: tuple(x[k] for k in keylist)
-    for key, group in groupby(sorted(input_list, key=keyfunc), key=keyfunc):
-        yield key, list(group)
+    sets = DisjointSets(n_guests)
+    for i, j in must_pairs:
+        sets.union(i, j)
+    return sets.clusters()
+
 
 def solve_party_seating(n_guests=100,
                         n_tables=10,
                         table_capacity=10,
                         must_not_pairs=None,
-                        must_pairs=None):
+                        must_pairs=None,
+                        stats=None):
     """
     Zgjidh problemin e uljes së mysafirëve me OR-Tools CP-SAT:
       - n_guests: numri total i mysafirëve
       - n_tables: numri total i tavolinave
-      - table_capacity: numri i vendeve për tavolinë (duhet të jetë n_guests // n_tables)
+      - table_capacity: numri i vendeve për tavolinë (duhet të jetë n_guests // n_tables),
+        ose listë me kapacitetin e secilës tavolinë (tavolina me madhësi të ndryshme, gjatësia
+        duhet të jetë n_tables; përndryshe ngrihet ValueError)
       - must_not_pairs = listë me çifte (i, j) që NUK duhet të ulen bashkë
       - must_pairs = listë me çifte (i, j) që DUHET të ulen bashkë
+      - stats: fjalor opsional që plotësohet me madhësinë e modelit dhe kohët
+        (preprocess, build, solve, decode)
+
+    Përpunimi paraprak:
+      - must_pairs bashkohen në grupe (union-find); çdo grup merr një IntVar 'tavolina'
+      - must_not_pairs bëhen një kufizim table[a] != table[b] për çift grupesh
+      - kapaciteti shprehet me një AddCumulative: çdo grup është interval me gjatësi 1
+        në pozicionin e tavolinës së tij, me kërkesë sa madhësia e grupit
+      - mysafirët e vetëm pa asnjë kufizim nuk hyjnë në model; ata plotësojnë vendet e lira
+        pas zgjidhjes (shuma e vendeve të lira është saktësisht numri i tyre)
 
     Kthen (status, assignment) ku:
       - status: statusi i zgjidhësit (cp_model.OPTIMAL, FEASIBLE, INFEASIBLE, etj.)
@@ -31,77 +95,438 @@ def solve_party_seating(n_guests=100,
         must_not_pairs = []
     if must_pairs is None:
         must_pairs = []
+    if stats is None:
+        stats = {}
+    return _solve_seating(n_guests, n_tables, table_capacity, must_not_pairs, must_pairs, stats)
 
-    # Do ta trajtojmë "week" = 0 pasi kemi vetëm një rregullim
-    weeks = [0]  # një "rreth" ose "javë" e vetme
-    guests = list(range(n_guests))
-    tables = list(range(n_tables))
 
-    # 1) Krijojmë modelin CP
+def _solve_seating(n_guests, n_tables, table_capacity, must_not_pairs, must_pairs, stats,
+                   guests=None, previous=None, time_limit=None, movable_tables=None, clustering=None):
+    """
+    Zbatimi i solve_party_seating. Për SeatingSession:
+      - guests: mysafirët aktivë (të tjerët janë anuluar); tavolinat mund të mbeten jo plot
+      - previous: caktimi i mëparshëm {guest: table}, që jepet si hint; objektivi minimizon numrin
+        e mysafirëve që ndërrojnë tavolinë, si të modeluarit ashtu edhe mysafirët e lirë që
+        zhvendosen kur grupet e modeluara u zënë vendet
+      - movable_tables: nëse jepet, vetëm grupet në këto tavolina (dhe grupet e reja) mund të
+        lëvizin, dhe vetëm brenda tyre; të tjerët mbeten të fiksuar në tavolinën e mëparshme
+      - clustering: (cluster_of, clusters) i llogaritur paraprakisht (p.sh. nga load_seating);
+        atëherë must_pairs nuk përdoret
+    """
+    partial = guests is not None
+    if guests is None:
+        guests = range(n_guests)
+
+    # 1) Përpunimi paraprak: grupet dhe çiftet e ndaluara midis grupeve
+    started = time.perf_counter()
+    if isinstance(table_capacity, int):
+        capacities = [table_capacity] * n_tables
+    else:
+        capacities = list(table_capacity)
+        if len(capacities) != n_tables:
+            raise ValueError(f"{len(capacities)} kapacitete për {n_tables} tavolina")
+    max_capacity = max(capacities)
+    if clustering is None:
+        clustering = cluster_guests(n_guests, must_pairs)
+    cluster_of, clusters = clustering
+    conflicts = set()
+    if partial:
+        feasible = len(guests) <= sum(capacities)
+    else:
+        feasible = n_guests == sum(capacities)
+    for i, j in must_not_pairs:
+        a, b = cluster_of[i], cluster_of[j]
+        if a == b:
+            feasible = False  # dy mysafirë që duhet të jenë bashkë dhe njëkohësisht të ndarë
+            break
+        conflicts.add((a, b) if a < b else (b, a))
+    if any(len(members) > max_capacity for members in clusters):
+        feasible = False
+
+    in_conflict = set()
+    for a, b in conflicts:
+        in_conflict.add(a)
+        in_conflict.add(b)
+    modeled = [c for c, members in enumerate(clusters) if len(members) > 1 or c in in_conflict]
+    stats['clusters'] = len(clusters)
+    stats['modeled_clusters'] = len(modeled)
+    stats['conflicts'] = len(conflicts)
+    stats['preprocess'] = time.perf_counter() - started
+    # Pamundësia e zbuluar këtu nuk varet nga caktimi i mëparshëm apo tavolinat e lëvizshme
+    stats['rejected'] = not feasible
+    if not feasible:
+        stats['build'] = stats['solve'] = stats['decode'] = 0.0
+        return cp_model.INFEASIBLE, None
+
+    # 2) Modeli: një IntVar tavoline për çdo grup të modeluar
+    started = time.perf_counter()
     model = cp_model.CpModel()
+    table = {}
+    intervals, demands = [], []
+    for c in modeled:
+        table[c] = model.NewIntVar(0, n_tables - 1, f"t_{c}")
+        intervals.append(model.NewFixedSizeIntervalVar(table[c], 1, f"i_{c}"))
+        demands.append(len(clusters[c]))
+    # Tavolinat më të vogla marrin një "rezervim" fiks që plotëson kapacitetin deri te maksimumi
+    for t, capacity in enumerate(capacities):
+        if capacity < max_capacity:
+            intervals.append(model.NewFixedSizeIntervalVar(t, 1, f"r_{t}"))
+            demands.append(max_capacity - capacity)
+    for a, b in conflicts:
+        model.Add(table[a] != table[b])
+    if previous is None:
+        # Tavolinat me të njëjtin kapacitet janë të këmbyeshme: grupi i parë i modeluar ulet
+        # në tavolinën e parë të njërës klasë kapaciteti (tavolina 0 kur të gjitha janë njësoj)
+        if modeled:
+            first_tables = {}
+            for t, capacity in enumerate(capacities):
+                first_tables.setdefault(capacity, t)
+            model.AddLinearExpressionInDomain(table[modeled[0]],
+                                              cp_model.Domain.FromValues(sorted(first_tables.values())))
+    else:
+        # Sa më pak lëvizje: çdo anëtar i modeluar që s'mbetet në tavolinën e tij të mëparshme
+        # numërohet një herë; hint-i është tavolina ku ishin shumica e anëtarëve të grupit
+        moved = []
+        # Mysafirët e lirë që mbeten në tavolinën t janë një kërkesë e ndryshueshme 0..free_at[t]
+        # në të njëjtin AddCumulative, pra s'kalojnë vendet që lënë grupet e modeluara; ata që
+        # s'mbeten zhvendosen dhe numërohen si lëvizje
+        free_at = [0] * n_tables
+        for g in guests:
+            if cluster_of[g] not in table and g in previous:
+                free_at[previous[g]] += 1
+        for t, count in enumerate(free_at):
+            if count:
+                kept = model.NewIntVar(0, count, f"f_{t}")
+                intervals.append(model.NewFixedSizeIntervalVar(t, 1, f"fi_{t}"))
+                demands.append(kept)
+                model.AddHint(kept, count)
+                moved.append(count - kept)
+        if movable_tables is not None:
+            movable_domain = cp_model.Domain.FromValues(sorted(movable_tables))
+        for c in modeled:
+            seats = [previous[g] for g in clusters[c] if g in previous]
+            target = max(set(seats), key=seats.count) if seats else None
+            if movable_tables is not None:
+                if target is not None and target not in movable_tables:
+                    model.Add(table[c] == target)
+                    continue
+                model.AddLinearExpressionInDomain(table[c], movable_domain)
+            if target is None:
+                continue
+            model.AddHint(table[c], target)
+            for t in set(seats):
+                count = seats.count(t)
+                if movable_tables is not None and t not in movable_tables:
+                    moved.append(count)  # kjo tavolinë s'është e arritshme: anëtarët lëvizin patjetër
+                    continue
+                stay = model.NewBoolVar(f"s_{c}_{t}")
+                model.Add(table[c] == t).OnlyEnforceIf(stay)
+                model.AddHint(stay, t == target)
+                moved.append(count * (1 - stay))
+        model.Minimize(sum(moved))
+    model.AddCumulative(intervals, demands, max_capacity)
+    proto = model.Proto()
+    stats['variables'] = len(proto.variables)
+    stats['constraints'] = len(proto.constraints)
+    stats['build'] = time.perf_counter() - started
 
-    # 2) Krijojmë variabla Booleane: x[g, w, t] = 1 nëse mysafiri g ulet në tavolinën t në "javën" w
-    x_var = {}
-    variables = []
-    for g, w, t in product(guests, weeks, tables):
-        var_name = f"x_{g}_{w}_{t}"
-        x_var[g, w, t] = model.NewBoolVar(var_name)
-        variables.append({
-            'Name': var_name,
-            'Guest': g,
-            'Week': w,
-            'Table': t,
-            'CP_Var': x_var[g, w, t]
-        })
-
-    # 3) Kufizimet
-
-    # A) Secili mysafir është saktësisht në 1 tavolinë
-    #    sum_{t in tables} x[g, w, t] = 1 për çdo mysafir g, javë w
-    def groupby_keys_func(item):
-        return (item['Guest'], item['Week'])
-    for _, group_list in groupby(sorted(variables, key=groupby_keys_func), key=groupby_keys_func):
-        model.Add(sum(v['CP_Var'] for v in group_list) == 1)
-
-    # B) Secila tavolinë ka saktësisht 'table_capacity' mysafirë
-    #    sum_{g in guests} x[g, w, t] = table_capacity për çdo tavolinë t, javë w
-    def groupby_keys_func2(item):
-        return (item['Week'], item['Table'])
-    for _, group_list in groupby(sorted(variables, key=groupby_keys_func2), key=groupby_keys_func2):
-        model.Add(sum(v['CP_Var'] for v in group_list) == table_capacity)
-
-    # C) must_not_pairs: nëse (i, j) nuk duhet të ulen bashkë,
-    #    atëherë x[i, w, t] + x[j, w, t] <= 1, pra s'mund të ndajnë tavolinën e njëjtë
-    for (i, j) in must_not_pairs:
-        for w in weeks:
-            for t in tables:
-                model.Add(x_var[i, w, t] + x_var[j, w, t] <= 1)
-
-    # D) must_pairs: nëse (i, j) duhet të ulen bashkë,
-    #    atëherë x[i, w, t] == x[j, w, t] për secilën tavolinë t, javë w
-    #    p.sh. ata zgjedhin pikërisht të njëjtën tavolinë
-    for (i, j) in must_pairs:
-        for w in weeks:
-            for t in tables:
-                model.Add(x_var[i, w, t] == x_var[j, w, t])
-
-    # 4) Zgjidhim
+    # 3) Zgjidhim
     solver = cp_model.CpSolver()
+    if time_limit is not None:
+        solver.parameters.max_time_in_seconds = time_limit
+    if previous is not None:
+        # Presolve-i kushton më shumë se vetë riparimi i caktimit të mëparshëm
+        solver.parameters.cp_model_presolve = False
+    started = time.perf_counter()
     status = solver.Solve(model)
+    stats['solve'] = time.perf_counter() - started
 
-    # 5) Interpretojmë rezultatin
+    # 4) Interpretojmë rezultatin: grupet e modeluara, pastaj mysafirët e lirë në vendet bosh
+    started = time.perf_counter()
+    assignment = None
     if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-        # Ndërtojmë një fjalor: assignment[guest] = table
         assignment = {}
+        free_seats = list(capacities)
+        for c in modeled:
+            t = solver.Value(table[c])
+            free_seats[t] -= len(clusters[c])
+            for g in clusters[c]:
+                assignment[g] = t
+        waiting = []
         for g in guests:
-            for t in tables:
-                w = 0  # kemi vetëm një "javë"
-                if solver.Value(x_var[g, w, t]) == 1:
-                    assignment[g] = t
-                    break
+            if g in assignment:
+                continue
+            t = previous.get(g) if previous is not None else None
+            if t is not None and free_seats[t] > 0:
+                assignment[g] = t
+                free_seats[t] -= 1
+            else:
+                waiting.append(g)
+        t = 0
+        for g in waiting:
+            while free_seats[t] == 0:
+                t += 1
+            assignment[g] = t
+            free_seats[t] -= 1
+    stats['decode'] = time.perf_counter() - started
+    return status, assignment
+
+class SeatingSession:
+    """
+    Sesion rikthyes për uljen e mysafirëve: ruan kufizimet dhe caktimin e fundit.
+    Ndryshimet (konflikte të reja, anulime, çifte të reja, mysafirë të shtuar me add_guest) zbatohen
+    me apply(), i cili rizgjidh modelin me caktimin e mëparshëm si hint dhe minimizon numrin e
+    mysafirëve që ndërrojnë tavolinë (përfshirë mysafirët e lirë që u zihet vendi).
+    Lëvizjet lejohen fillimisht vetëm në tavolinat e prekura dhe fqinjët e tyre; lagjja dyfishohet
+    derisa të gjendet caktim, dhe në fund provohet i gjithë modeli. Minimumi është pra brenda
+    lagjes së parë ku gjendet caktim, jo domosdoshmërisht mbi të gjitha tavolinat.
+    'time_limit' (sekonda) kufizon çdo rizgjidhje pas ndryshimeve; kur mbaron, kthehet caktimi më i mirë i gjetur
+    (status FEASIBLE).
+    """
+    def __init__(self, n_guests, n_tables, table_capacity, must_not_pairs=None, must_pairs=None,
+                 time_limit=1.0):
+        self.n_guests = n_guests
+        self.n_tables = n_tables
+        self.table_capacity = table_capacity
+        self.active = set(range(n_guests))
+        self.must_not = set(self._pair(i, j) for i, j in must_not_pairs or [])
+        self.must = set(self._pair(i, j) for i, j in must_pairs or [])
+        self.time_limit = time_limit
+        self.assignment = None
+        self.stats = {}
+        self._commit()
+
+    @staticmethod
+    def _pair(i, j):
+        return (i, j) if i < j else (j, i)
+
+    def _commit(self):
+        # Gjendja e fundit e vlefshme, ku kthehet sesioni kur ndryshimet dalin të pamundura
+        self._saved = (self.n_guests, set(self.active), set(self.must_not), set(self.must))
+
+    def _rollback(self):
+        n_guests, active, must_not, must = self._saved
+        self.n_guests, self.active, self.must_not, self.must = n_guests, set(active), set(must_not), set(must)
+
+    def _solve(self, previous, time_limit=None, movable_tables=None):
+        self.stats = {}
+        status, assignment = _solve_seating(
+            self.n_guests, self.n_tables, self.table_capacity,
+            sorted(self.must_not), sorted(self.must), self.stats,
+            guests=sorted(self.active), previous=previous, time_limit=time_limit,
+            movable_tables=movable_tables)
+        if assignment is not None:
+            self.assignment = assignment
+            self._commit()
         return status, assignment
-    else:
-        return status, None
+
+    def solve(self):
+        """Zgjidhja e parë (pa caktim të mëparshëm dhe pa kufi kohe). Kthen (status, assignment)."""
+        return self._solve(None)
+
+    def add_guest(self):
+        """
+        Shton një mysafir të ri dhe kthen numrin e tij. Ai ulet në apply() të radhës; nëse ai
+        apply() del i pamundur, shtimi anulohet bashkë me ndryshimet e tjera.
+        """
+        guest = self.n_guests
+        self.n_guests += 1
+        self.active.add(guest)
+        return guest
+
+    def apply(self, add_must_not=(), remove_must_not=(), add_must=(), remove_must=(), cancel=()):
+        """
+        Zbaton një grup ndryshimesh dhe rizgjidh nga caktimi i fundit.
+        Kthen (status, assignment, moved) ku 'moved' është numri i mysafirëve që ndërruan tavolinë.
+        """
+        for guest in cancel:
+            self.active.discard(guest)
+        self.must_not.difference_update(self._pair(i, j) for i, j in remove_must_not)
+        self.must.difference_update(self._pair(i, j) for i, j in remove_must)
+        self.must_not.update(self._pair(i, j) for i, j in add_must_not)
+        self.must.update(self._pair(i, j) for i, j in add_must)
+        # Çiftet me mysafirë të anuluar nuk kanë më kuptim
+        self.must_not = set(p for p in self.must_not if p[0] in self.active and p[1] in self.active)
+        self.must = set(p for p in self.must if p[0] in self.active and p[1] in self.active)
+
+        previous = self.assignment
+        if previous is None:
+            status, assignment = self._solve(None)
+            moved = 0
+        else:
+            # Tavolinat e prekura nga ndryshimet; lagjja e tavolinave të lëvizshme zgjerohet me dyfishim
+            touched = set()
+            for i, j in list(add_must_not) + list(add_must) + list(remove_must_not) + list(remove_must):
+                touched.update(previous[g] for g in (i, j) if g in previous)
+            touched.update(previous[g] for g in cancel if g in previous)
+            previous = {g: t for g, t in previous.items() if g in self.active}
+            status, assignment = self._solve_nearby(previous, touched)
+            moved = sum(1 for g, t in assignment.items() if g in previous and previous[g] != t) \
+                if assignment is not None else 0
+        if assignment is None:
+            # Ndryshimet e pamundura nuk ruhen: sesioni mbetet te gjendja e fundit e vlefshme
+            self._rollback()
+        return status, assignment, moved
+
+    def _solve_nearby(self, previous, touched):
+        """Rizgjidhja me lagje tavolinash që dyfishohet; pa tavolina të prekura shkohet te i gjithë modeli."""
+        width = 2
+        while touched:
+            movable = set((t + d) % self.n_tables for t in touched for d in range(width))
+            if len(movable) >= self.n_tables:
+                break
+            status, assignment = self._solve(previous, self.time_limit, movable)
+            if assignment is not None or self.stats['rejected']:
+                return status, assignment
+            width *= 2
+        # I gjithë modeli; nëse brenda kufirit kohor s'gjendet caktim, rizgjidhet pa kufi
+        status, assignment = self._solve(previous, self.time_limit)
+        if status == cp_model.UNKNOWN:
+            status, assignment = self._solve(previous)
+        return status, assignment
+
+
+class SeatingData:
+    """
+    Të dhënat e një ngjarjeje të lexuara nga load_seating:
+      - names: emrat e mysafirëve (indeksi = numri i mysafirit)
+      - capacities: kapaciteti i secilës tavolinë
+      - clustering: (cluster_of, clusters) nga çiftet "must", të bashkuara gjatë leximit
+      - must_not: array me çiftet "must_not" të rrafshuara [i0, j0, i1, j1, ...]
+    """
+    def __init__(self, names, capacities, clustering, must_not):
+        self.names = names
+        self.capacities = capacities
+        self.clustering = clustering
+        self.must_not = must_not
+
+    def must_not_pairs(self):
+        pairs = iter(self.must_not)
+        return zip(pairs, pairs)
+
+
+def _read_records(path):
+    """
+    Lexon rekordet si rrjedhë dhe kthen (numri i rreshtit, lloji, vlerat).
+    CSV: rreshta 'guest,<emri>', 'table,<kapaciteti>', 'must,<a>,<b>', 'must_not,<a>,<b>'.
+    JSON lines (.jsonl/.json): {"guest": "Ana"}, {"table": 8}, {"must": ["Ana", "Ben"]}, {"must_not": [...]}.
+    """
+    with open(path, newline="") as source:
+        if path.endswith((".jsonl", ".json")):
+            for line_no, line in enumerate(source, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if len(record) != 1:
+                    raise ValueError(f"rreshti {line_no}: pritej saktësisht një çelës, u gjet {sorted(record)}")
+                kind, value = next(iter(record.items()))
+                yield line_no, kind, value if isinstance(value, list) else [value]
+        else:
+            for line_no, row in enumerate(csv.reader(source), 1):
+                if not row or row[0].startswith("#") or (line_no == 1 and row[0] == "type"):
+                    continue
+                yield line_no, row[0].strip(), [cell.strip() for cell in row[1:]]
+
+
+def load_seating(path):
+    """
+    Lexon mysafirët, tavolinat dhe çiftet nga një skedar CSV ose JSON lines në një kalim të vetëm.
+    Mysafirët duhet të deklarohen para çifteve që i përmendin. Gjatë leximit çiftet "must"
+    bashkohen menjëherë me union-find (nuk ruhen), ndërsa "must_not" ruhen në një array kompakt.
+    Para zgjidhjes kontrollohen: emrat e dyfishtë, mysafirët e panjohur, kapacitetet,
+    shuma e kapaciteteve kundrejt numrit të mysafirëve, grupet më të mëdha se tavolina më e madhe
+    dhe çiftet kontradiktore (must dhe must_not për të njëjtin grup). Gabimet ngrenë ValueError.
+    """
+    names, index = [], {}
+    capacities = []
+    sets = DisjointSets()
+    must_not = array("l")
+    largest_cluster = 1
+
+    def guest(line_no, name):
+        if name not in index:
+            raise ValueError(f"rreshti {line_no}: mysafir i panjohur '{name}'")
+        return index[name]
+
+    for line_no, kind, values in _read_records(path):
+        if not values or values[0] in ("", None):
+            raise ValueError(f"rreshti {line_no}: rekordi '{kind}' nuk ka vlerë")
+        if kind == "guest":
+            name = str(values[0])
+            if name in index:
+                raise ValueError(f"rreshti {line_no}: mysafiri '{name}' është deklaruar dy herë")
+            index[name] = sets.add()
+            names.append(name)
+        elif kind == "table":
+            try:
+                capacity = int(str(values[0]).strip())
+            except ValueError:
+                raise ValueError(f"rreshti {line_no}: kapacitet jo numër i plotë '{values[0]}'") from None
+            if capacity <= 0:
+                raise ValueError(f"rreshti {line_no}: kapaciteti duhet të jetë pozitiv")
+            capacities.append(capacity)
+        elif kind in ("must", "must_not"):
+            if len(values) != 2:
+                raise ValueError(f"rreshti {line_no}: një çift duhet të ketë dy mysafirë")
+            i, j = guest(line_no, str(values[0])), guest(line_no, str(values[1]))
+            if i == j:
+                raise ValueError(f"rreshti {line_no}: çift me të njëjtin mysafir '{names[i]}'")
+            if kind == "must":
+                largest_cluster = max(largest_cluster, sets.union(i, j))
+            else:
+                must_not.append(i)
+                must_not.append(j)
+        else:
+            raise ValueError(f"rreshti {line_no}: lloj i panjohur rekordi '{kind}'")
+
+    if not capacities:
+        raise ValueError("nuk u deklarua asnjë tavolinë")
+    if sum(capacities) < len(names):
+        raise ValueError(f"{len(names)} mysafirë, por vetëm {sum(capacities)} vende")
+    if largest_cluster > max(capacities):
+        raise ValueError(f"një grup 'must' ka {largest_cluster} mysafirë, tavolina më e madhe {max(capacities)}")
+    data = SeatingData(names, capacities, sets.clusters(), must_not)
+    cluster_of = data.clustering[0]
+    for i, j in data.must_not_pairs():
+        if cluster_of[i] == cluster_of[j]:
+            raise ValueError(f"çift kontradiktor: '{names[i]}' dhe '{names[j]}' duhet dhe nuk duhet të ulen bashkë")
+    return data
+
+
+def write_assignment(path, assignment, names):
+    """Shkruan caktimin si rrjedhë, një mysafir për rresht (CSV 'guest,table' ose JSON lines)."""
+    with open(path, "w", newline="") as out:
+        if path.endswith((".jsonl", ".json")):
+            for g, name in enumerate(names):
+                out.write(json.dumps({"guest": name, "table": assignment[g]}) + "\n")
+        else:
+            writer = csv.writer(out)
+            writer.writerow(["guest", "table"])
+            for g, name in enumerate(names):
+                writer.writerow([name, assignment[g]])
+
+
+def solve_seating_file(input_path, output_path, stats=None):
+    """
+    Lexon dhe validon një ngjarje nga skedari, e zgjidh dhe shkruan caktimin.
+    Tavolinat mund të mbeten jo plot kur ka më shumë vende se mysafirë. Kthen statusin e solver-it.
+    """
+    if stats is None:
+        stats = {}
+    started = time.perf_counter()
+    data = load_seating(input_path)
+    stats['load'] = time.perf_counter() - started
+    n_guests = len(data.names)
+    status, assignment = _solve_seating(n_guests, len(data.capacities), data.capacities,
+                                        data.must_not_pairs(), None, stats,
+                                        guests=range(n_guests), clustering=data.clustering)
+    if assignment is not None:
+        started = time.perf_counter()
+        write_assignment(output_path, assignment, data.names)
+        stats['write'] = time.perf_counter() - started
+    return status
+
 
 def main():
     # Shembull kufizimesh "must_not" (s'duhet bashkë)
@@ -117,13 +542,19 @@ def main():
         (95, 99)
     ]
 
+    stats = {}
     status, assignment = solve_party_seating(
         n_guests=100,
         n_tables=10,
         table_capacity=10,
         must_not_pairs=must_not,
-        must_pairs=must_pairs
+        must_pairs=must_pairs,
+        stats=stats
     )
+    print(f"Grupe: {stats['clusters']} (në model: {stats['modeled_clusters']}), "
+          f"ndryshore: {stats.get('variables', 0)}, kufizime: {stats.get('constraints', 0)}")
+    print(f"Kohët: përpunimi {stats['preprocess']:.3f} s, ndërtimi {stats['build']:.3f} s, "
+          f"zgjidhja {stats['solve']:.3f} s, dekodimi {stats['decode']:.3f} s")
 
     if assignment is None:
         print("Nuk u gjet asnjë rregullim i vlefshëm (INFEASIBLE).")
@@ -139,4 +570,17 @@ def main():
             print(f"Tavolina {t+1}: {table_assignments[t]}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) == 3:
+        # python Sat-Problem.py ngjarja.csv caktimi.csv
+        try:
+            stats = {}
+            status = solve_seating_file(sys.argv[1], sys.argv[2], stats)
+        except ValueError as error:
+            sys.exit(f"Të dhëna të pavlefshme: {error}")
+        if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+            print(f"Caktimi u shkrua në {sys.argv[2]}")
+        else:
+            print("Nuk u gjet asnjë rregullim i vlefshëm.")
+        print(", ".join(f"{key}: {value:.3f} s" for key, value in stats.items() if isinstance(value, float)))
+    else:
+        main()
\ No newline at end of file
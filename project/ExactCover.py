@@ -0,0 +1,189 @@
+"""
+Algoritmi X i Knuth-it për problemin e mbulimit të saktë (exact cover).
+
+Në vend të listave të lidhura (Dancing Links) përdoret paraqitja me fjalorë dhe sete:
+  - columns[c] = seti i opsioneve që mbulojnë kolonën c
+  - options[o] = lista e kolonave që mbulon opsioni o
+Heqja dhe rikthimi i kolonave bëhet në të njëjtën mënyrë si te DLX, por me operacione setesh.
+
+Kolonat primare duhet të mbulohen saktësisht një herë, ndërsa kolonat sekondare
+(p.sh. diagonalet te N-Mbretëreshat) mbulohen më së shumti një herë.
+"""
+
+
+class ExactCover:
+    def __init__(self, options, primary, secondary=()):
+        """
+        :param options: fjalor {opsioni: [kolonat që mbulon]}
+        :param primary: kolonat që duhet të mbulohen saktësisht një herë
+        :param secondary: kolonat që mund të mbulohen më së shumti një herë
+        """
+        self.options = {key: list(cols) for key, cols in options.items()}
+        self.primary = set(primary)
+        self.columns = {c: set() for c in self.primary}
+        for c in secondary:
+            self.columns[c] = set()
+        for key, cols in self.options.items():
+            for c in cols:
+                self.columns[c].add(key)
+        self.has_secondary = len(self.columns) != len(self.primary)
+        self.partial = []
+        self.feasible = True
+
+    def preselect(self, option):
+        """
+        Zgjedh paraprakisht një opsion (p.sh. një qelizë e dhënë).
+        Nëse opsioni bie ndesh me zgjedhjet e mëparshme, problemi shënohet si i pazgjidhshëm.
+        """
+        if not self.feasible:
+            return
+        if option not in self.options or any(c not in self.columns or option not in self.columns[c]
+                                             for c in self.options[option]):
+            self.feasible = False
+            return
+        self._select(option)
+        self.partial.append(option)
+
+    def _select(self, option):
+        columns, options = self.columns, self.options
+        removed = []
+        for c in options[option]:
+            for other in columns[c]:
+                for k in options[other]:
+                    if k != c:
+                        columns[k].discard(other)
+            removed.append(columns.pop(c))
+        return removed
+
+    def _deselect(self, option, removed):
+        columns, options = self.columns, self.options
+        for c in reversed(options[option]):
+            columns[c] = removed.pop()
+            for other in columns[c]:
+                for k in options[other]:
+                    if k != c:
+                        columns[k].add(other)
+
+    def _choose_column(self):
+        """Zgjedh kolonën primare me më pak opsione (heuristika S e Knuth-it)."""
+        columns = self.columns
+        if self.has_secondary:
+            remaining = [c for c in columns if c in self.primary]
+        else:
+            remaining = columns
+        if not remaining:
+            return None
+        return min(remaining, key=lambda c: len(columns[c]))
+
+    def solutions(self):
+        """Gjenerator që kthen çdo zgjidhje si listë opsionesh (përfshirë ato të zgjedhura paraprakisht)."""
+        if not self.feasible:
+            return
+        solution = list(self.partial)
+        yield from self._search(solution)
+
+    def _search(self, solution):
+        column = self._choose_column()
+        if column is None:
+            yield list(solution)
+            return
+        for option in list(self.columns[column]):
+            solution.append(option)
+            removed = self._select(option)
+            try:
+                yield from self._search(solution)
+            finally:
+                # Ekzekutohet edhe kur gjeneratori mbyllet para kohe (p.sh. nga first_solution),
+                # që objekti të kthehet në gjendjen fillestare
+                self._deselect(option, removed)
+                solution.pop()
+
+    def first_solution(self):
+        """Kthen zgjidhjen e parë ose None nëse nuk ka zgjidhje."""
+        search = self.solutions()
+        try:
+            return next(search, None)
+        finally:
+            search.close()
+
+    def count(self):
+        """Numëron të gjitha zgjidhjet pa i ndërtuar ato."""
+        if not self.feasible:
+            return 0
+        return self._count()
+
+    def _count(self):
+        column = self._choose_column()
+        if column is None:
+            return 1
+        candidates = self.columns[column]
+        if not candidates:
+            return 0
+        total = 0
+        for option in list(candidates):
+            removed = self._select(option)
+            total += self._count()
+            self._deselect(option, removed)
+        return total
+
+
+def latin_square_cover(grid, box_size=None):
+    """
+    Ndërton problemin e mbulimit të saktë për një katror latin të pjesshëm (n x n, 0 = bosh).
+    Opsionet janë (row, col, num). Nëse jepet 'box_size', shtohen edhe kutitë (Sudoku).
+    """
+    n = len(grid)
+    options = {}
+    for r in range(n):
+        for c in range(n):
+            for num in range(1, n + 1):
+                cols = [("cell", r, c), ("row", r, num), ("col", c, num)]
+                if box_size:
+                    box = (r // box_size) * (n // box_size) + c // box_size
+                    cols.append(("box", box, num))
+                options[r, c, num] = cols
+    primary = set(col for cols in options.values() for col in cols)
+
+    cover = ExactCover(options, primary)
+    for r in range(n):
+        for c in range(n):
+            if grid[r][c]:
+                cover.preselect((r, c, grid[r][c]))
+    return cover
+
+
+def sudoku_cover(board):
+    """Ndërton problemin e mbulimit të saktë për një tabelë Sudoku 9x9."""
+    return latin_square_cover(board, box_size=3)
+
+
+def blocked_n_queens_cover(n, blocked_positions=()):
+    """
+    Ndërton problemin e mbulimit të saktë për N-Mbretëreshat e Bllokuara.
+    Rreshtat dhe kolonat janë primare, diagonalet sekondare. Opsionet janë (row, col).
+    """
+    blocked = set(blocked_positions)
+    options = {}
+    for r in range(n):
+        for c in range(n):
+            if (r, c) not in blocked:
+                options[r, c] = [("row", r), ("col", c), ("diag", r - c), ("anti", r + c)]
+    primary = [("row", r) for r in range(n)] + [("col", c) for c in range(n)]
+    secondary = [("diag", d) for d in range(-n + 1, n)] + [("anti", d) for d in range(2 * n - 1)]
+    return ExactCover(options, primary, secondary)
+
+
+def solution_to_grid(solution, n):
+    """Kthen zgjidhjen e katrorit latin / Sudoku-së (lista e (row, col, num)) në matricë n x n."""
+    grid = [[0] * n for _ in range(n)]
+    for r, c, num in solution:
+        grid[r][c] = num
+    return grid
+
+
+def solution_to_queens(solution, n):
+    """Kthen zgjidhjen e N-Mbretëreshave (lista e (row, col)) si listë kolonash për secilin rresht."""
+    state = [0] * n
+    for r, c in solution:
+        state[r] = c
+    return state
@@ -1,3 +1,9 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from math import factorial
+
 def is_valid(matrix, row, col, num):
     """Shiko nëse vendosja e num tel matrix[row][col] është e lejuar."""
     for i in range(len(matrix)):
@@ -5,8 +11,37 @@ def is_valid(matrix, row, col, num):
             return False
     return True
 
-def iddfs_backtracking(n):
-    """Krijo një katror latin duke përdorur IDDFS dhe Backtracking."""
+def cyclic_latin_square(n, randomize=False, seed=None):
+    """
+    Ndërton direkt një katror latin në O(n²) me konstruksionin ciklik (grupi Z_n):
+    matrix[i][j] = (j - i) mod n + 1, pa asnjë kërkim.
+    Nëse randomize=True, permutohen rastësisht rreshtat, kolonat dhe simbolet,
+    kështu që fitohen katrorë të ndryshëm pa e humbur vetinë latine.
+    """
+    if n <= 0:
+        return None
+
+    rows = list(range(n))
+    cols = list(range(n))
+    symbols = list(range(1, n + 1))
+    if randomize:
+        rng = random.Random(seed)
+        rng.shuffle(rows)
+        rng.shuffle(cols)
+        rng.shuffle(symbols)
+
+    # Çdo rresht është zhvendosje ciklike e rreshtit të parë (pas permutimit të simboleve)
+    base = [symbols[c] for c in cols]
+    return [base[n - shift:] + base[:n - shift] for shift in rows]
+
+def iddfs_backtracking(n, fast=False, randomize=False, seed=None):
+    """
+    Krijo një katror latin duke përdorur IDDFS dhe Backtracking.
+    Me fast=True katrori ndërtohet direkt me cyclic_latin_square (O(n²), pa kërkim).
+    """
+    if fast:
+        return cyclic_latin_square(n, randomize=randomize, seed=seed)
+
     def solve(matrix, row, col, depth):
         if row == n:  # Gjithë rreshtat janë mbushur
             return True
@@ -30,13 +65,322 @@ def iddfs_backtracking(n):
 
     return None
 
-# Hyrja
-n = int(input("Hyrja: "))
-latin_square = iddfs_backtracking(n)
+class _BudgetExceeded(Exception):
+    """Ngrihet brenda kërkimit kur tejkalohet kufiri i nyjeve ose i kohës."""
+
+def complete_latin_square(grid, max_nodes=None, time_limit=None):
+    """
+    Plotëson një katror latin të pjesshëm (quasigroup completion). Qelizat bosh janë 0.
+      - Për çdo rresht dhe kolonë mbahet një bitset i simboleve të përdorura.
+      - Zgjidhet gjithmonë qeliza me më pak kandidatë (MRV).
+      - Pas çdo vendosjeje kontrollohen rreshti dhe kolona e prekur (forward checking):
+        qelizat pa kandidatë dhe simbolet pa vend zbulohen menjëherë, ndërsa
+        qelizat/simbolet me vetëm një mundësi vendosen pa degëzim.
+      - max_nodes / time_limit (sekonda) kufizojnë kërkimin.
+
+    Kthen (matrix, stats): matrix është katrori i plotësuar ose None;
+    stats përmban 'status' ("solved", "infeasible", "budget"), 'nodes', 'elapsed' dhe 'nodes_per_sec'.
+    """
+    n = len(grid)
+    full = ((1 << n) - 1) << 1  # bitet 1..n
+    matrix = [row[:] for row in grid]
+    row_used = [0] * n
+    col_used = [0] * n
+    row_empty = [set() for _ in range(n)]
+    col_empty = [set() for _ in range(n)]
+    empty = set()
+    trail = []
+    stats = {"status": "infeasible", "nodes": 0, "elapsed": 0.0, "nodes_per_sec": 0.0}
+    started = time.perf_counter()
+    deadline = started + time_limit if time_limit is not None else None
+
+    def finish(result, status):
+        stats["status"] = status
+        stats["elapsed"] = time.perf_counter() - started
+        if stats["elapsed"] > 0:
+            stats["nodes_per_sec"] = stats["nodes"] / stats["elapsed"]
+        return result, stats
+
+    for r in range(n):
+        for c in range(n):
+            num = matrix[r][c]
+            if num == 0:
+                empty.add((r, c))
+                row_empty[r].add(c)
+                col_empty[c].add(r)
+                continue
+            bit = 1 << num
+            if not 1 <= num <= n or (row_used[r] | col_used[c]) & bit:
+                return finish(None, "infeasible")
+            row_used[r] |= bit
+            col_used[c] |= bit
+
+    def assign(r, c, bit):
+        row_used[r] |= bit
+        col_used[c] |= bit
+        matrix[r][c] = bit.bit_length() - 1
+        empty.discard((r, c))
+        row_empty[r].discard(c)
+        col_empty[c].discard(r)
+        trail.append((r, c, bit))
+
+    def undo(size):
+        while len(trail) > size:
+            r, c, bit = trail.pop()
+            row_used[r] ^= bit
+            col_used[c] ^= bit
+            matrix[r][c] = 0
+            empty.add((r, c))
+            row_empty[r].add(c)
+            col_empty[c].add(r)
+
+    def forced_in_line(is_row, i):
+        """
+        Kontrollon një rresht/kolonë. Kthen False për kontradiktë, një vendosje të detyruar
+        (r, c, bit) ose None nëse nuk ka asgjë për t'u vendosur.
+        """
+        if is_row:
+            cells = [(i, c, full & ~(row_used[i] | col_used[c])) for c in row_empty[i]]
+            missing = full & ~row_used[i]
+        else:
+            cells = [(r, i, full & ~(row_used[r] | col_used[i])) for r in col_empty[i]]
+            missing = full & ~col_used[i]
+        seen_once = seen_twice = 0
+        for r, c, mask in cells:
+            if not mask:
+                return False
+            if not mask & (mask - 1):
+                return r, c, mask  # Vetëm një kandidat
+            seen_twice |= seen_once & mask
+            seen_once |= mask
+        if seen_once != missing:
+            return False  # Ndonjë simbol nuk ka më vend
+        hidden = missing & ~seen_twice
+        if hidden:
+            bit = hidden & -hidden
+            for r, c, mask in cells:
+                if mask & bit:
+                    return r, c, bit
+        return None
+
+    def propagate(lines):
+        pending = list(lines)
+        while pending:
+            forced = forced_in_line(*pending.pop())
+            if forced is False:
+                return False
+            if forced is not None:
+                r, c, bit = forced
+                assign(r, c, bit)
+                pending.extend(((True, r), (False, c)))
+        return True
+
+    def choose_cell():
+        best, best_mask, best_count = None, 0, n + 1
+        for r, c in empty:
+            mask = full & ~(row_used[r] | col_used[c])
+            count = bin(mask).count("1")
+            if count < best_count:
+                best, best_mask, best_count = (r, c), mask, count
+                if count <= 2:
+                    break
+        return best, best_mask
+
+    if not propagate([(True, i) for i in range(n)] + [(False, i) for i in range(n)]):
+        return finish(None, "infeasible")
+
+    # Kërkim iterativ (pa rekursion) që të funksionojë edhe për n të mëdha.
+    # Çdo kornizë mban: gjatësinë e trail-it para degëzimit, qelizën dhe kandidatët e mbetur.
+    stack = []
+    while empty:
+        stats["nodes"] += 1
+        if max_nodes is not None and stats["nodes"] > max_nodes:
+            return finish(None, "budget")
+        if deadline is not None and stats["nodes"] & 255 == 0 and time.perf_counter() > deadline:
+            return finish(None, "budget")
+
+        cell, mask = choose_cell()
+        stack.append([len(trail), cell, mask])
+        while stack:
+            frame = stack[-1]
+            undo(frame[0])
+            if not frame[2]:
+                stack.pop()
+                continue
+            bit = frame[2] & -frame[2]
+            frame[2] ^= bit
+            r, c = frame[1]
+            assign(r, c, bit)
+            if propagate([(True, r), (False, c)]):
+                break
+        else:
+            return finish(None, "infeasible")
+
+    return finish(matrix, "solved")
+
+def _compatible_rows(n, col_used, first=None):
+    """
+    Gjeneron të gjitha rreshtat (permutacione të 1..n) që nuk përsërisin simbol në asnjë kolonë.
+    col_used[c] është bitset-i i simboleve të përdorura në kolonën c; 'first' fikson kolonën 0.
+    """
+    full = ((1 << n) - 1) << 1
+    row = [0] * n
+
+    def place(c, row_mask):
+        if c == n:
+            yield tuple(row)
+            return
+        avail = full & ~(col_used[c] | row_mask)
+        if c == 0 and first is not None:
+            avail &= 1 << first
+        while avail:
+            bit = avail & -avail
+            avail ^= bit
+            row[c] = bit.bit_length() - 1
+            yield from place(c + 1, row_mask | bit)
+
+    yield from place(0, 0)
+
+def iter_latin_squares(n, reduced=False):
+    """
+    Gjenerator që kthen (stream) çdo katror latin të rendit n, rresht pas rreshti.
+    Me reduced=True kthehen vetëm katrorët në formë të reduktuar
+    (rreshti dhe kolona e parë janë 1, 2, ..., n).
+    """
+    if n <= 0:
+        return
+    col_used = [0] * n
+    rows = []
+
+    def fill(r):
+        if r == n:
+            yield [list(row) for row in rows]
+            return
+        first = r + 1 if reduced else None
+        candidates = [tuple(range(1, n + 1))] if reduced and r == 0 else _compatible_rows(n, col_used, first)
+        for row in candidates:
+            for c, num in enumerate(row):
+                col_used[c] |= 1 << num
+            rows.append(row)
+            yield from fill(r + 1)
+            rows.pop()
+            for c, num in enumerate(row):
+                col_used[c] ^= 1 << num
+
+    yield from fill(0)
+
+def _count_reduced_from(n, prefix):
+    """
+    Numëron katrorët latinë të reduktuar që fillojnë me rreshtat 'prefix'.
+    Rreshti i parafundit nuk kërkohet: kur mbeten dy rreshta, çdo kolonë ka saktësisht
+    dy simbole që mungojnë, dhe këto kolona formojnë cikle mbi simbolet. Çdo cikël mund
+    të orientohet në 2 mënyra, përveç ciklit që përmban kolonën 0 (e fiksuar), ndërsa
+    rreshti i fundit është i detyruar. Pra numri i plotësimeve është 2^(cikle - 1).
+    """
+    col_used = [0] * n
+    for row in prefix:
+        for c, num in enumerate(row):
+            col_used[c] |= 1 << num
+
+    def completions_of_last_two():
+        parent = list(range(n + 1))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        full = ((1 << n) - 1) << 1
+        cycles = n
+        for c in range(n):
+            missing = full & ~col_used[c]
+            low = missing & -missing
+            a, b = find(low.bit_length() - 1), find((missing ^ low).bit_length() - 1)
+            if a != b:
+                parent[a] = b
+                cycles -= 1
+        return 1 << (cycles - 1)
+
+    def fill(r):
+        if r == n - 2:
+            return completions_of_last_two()
+        total = 0
+        for row in _compatible_rows(n, col_used, first=r + 1):
+            for c, num in enumerate(row):
+                col_used[c] |= 1 << num
+            total += fill(r + 1)
+            for c, num in enumerate(row):
+                col_used[c] ^= 1 << num
+        return total
+
+    return fill(len(prefix))
+
+def _count_subtree(task):
+    """Punëtori i pool-it: numëron nënpemën që fillon nga një prefiks rreshtash."""
+    n, prefix = task
+    return _count_reduced_from(n, prefix)
+
+def _split_prefixes(n, split_depth):
+    """Kthen të gjithë prefikset e reduktuara me 1 + split_depth rreshta (ndarja e pemës së kërkimit)."""
+    prefixes = [[tuple(range(1, n + 1))]]
+    for r in range(1, 1 + split_depth):
+        next_prefixes = []
+        for prefix in prefixes:
+            col_used = [0] * n
+            for row in prefix:
+                for c, num in enumerate(row):
+                    col_used[c] |= 1 << num
+            for row in _compatible_rows(n, col_used, first=r + 1):
+                next_prefixes.append(prefix + [row])
+        prefixes = next_prefixes
+    return prefixes
+
+def count_reduced_latin_squares(n, split_depth=1, workers=None):
+    """
+    Numëron katrorët latinë të reduktuar të rendit n.
+    Pema e kërkimit ndahet pas 'split_depth' rreshtave (pas të parit) dhe nënpemët
+    shpërndahen në një ProcessPoolExecutor. workers=1 e bën numërimin serik.
+    """
+    if n <= 2:
+        return 1 if n >= 1 else 0
+    # Duhet të mbeten të paktën dy rreshta për hapin me cikle
+    split_depth = max(0, min(split_depth, n - 3))
+    prefixes = _split_prefixes(n, split_depth)
+    tasks = [(n, prefix) for prefix in prefixes]
+
+    if workers == 1 or len(tasks) == 1:
+        return sum(map(_count_subtree, tasks))
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(_count_subtree, tasks, chunksize=chunksize))
+
+def count_latin_squares(n, split_depth=1, workers=None):
+    """
+    Numëron të gjithë katrorët latinë të rendit n duke numëruar vetëm formën e reduktuar
+    dhe duke shumëzuar me faktorin e simetrisë n! * (n - 1)!
+    (permutimet e kolonave dhe të rreshtave pas të parit).
+    """
+    if n <= 0:
+        return 0
+    return count_reduced_latin_squares(n, split_depth, workers) * factorial(n) * factorial(n - 1)
+
+# Mbi këtë rend kërkimi bëhet i ngadalshëm, prandaj përdoret konstruksioni i drejtpërdrejtë
+FAST_MODE_MIN_ORDER = 12
+
+def main():
+    # Hyrja
+    n = int(input("Hyrja: "))
+    latin_square = iddfs_backtracking(n, fast=n >= FAST_MODE_MIN_ORDER)
+
+    # Output
+    if latin_square:
+        for row in latin_square:
+            print(" ".join(map(str, row)))
+    else:
+        print("Nuk mund të krijohet një katror latin për këtë hyrje.")
 
-# Output
-if latin_square:
-    for row in latin_square:
-        print(" ".join(map(str, row)))
-else:
-    print("Nuk mund të krijohet një katror latin për këtë hyrje.")
+if __name__ == "__main__":
+    main()
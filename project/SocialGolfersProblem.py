@@ -1,89 +1,300 @@
+import time
+
 from ortools.sat.python import cp_model
-from itertools import product, groupby, combinations
-
-# Funksion ndihmës për të iteruar mbi artikujt e grupuar
-def groupby_keys(input_list, keylist):
-    keyfunc = lambda x: tuple(x[k] for k in keylist)
-    for key, group in groupby(sorted(input_list, key=keyfunc), key=keyfunc):
-        yield key, list(group)
-
-# Përkufizimi i problemit
-
-n_players = int(input("Numri i lojtarëve: ")) # Numri i lojtarëve
-n_weeks = int(input("Numri i javëve: ")) # Numri i javëve
-players_per_group = int(input("Numri i lojtarëve për grup: ")) # Numri i lojtarëve për grup
-
-# Parametrat e nxjerrë
-n_groups = n_players // players_per_group  # Numri i grupeve
-players = list(range(n_players))  # Lista e lojtarëve
-weeks = list(range(n_weeks))  # Lista e javëve
-groups = list(range(n_groups))  # Lista e grupeve
-
-# Inicializo modelin
-model = cp_model.CpModel()
-
-# Ndryshoret
-variables = []
-player_vars = {}
-for player, week, group in product(players, weeks, groups):
-    v_name = f"{player}_{week}_{group}"
-    the_var = model.NewBoolVar(v_name)
-    variables.append(
-        {k: v for v, k in zip([v_name, player, week, group, the_var], ['Name', 'Player', 'Week', 'Group', 'CP_Var'])}
-    )
-    player_vars[player, week, group] = the_var
-
-# Kufizimet
-
-# Çdo lojtar duhet të jetë saktësisht në një grup për çdo javë
-for _, grp in groupby_keys(variables, ['Player', 'Week']):
-    model.Add(sum(x['CP_Var'] for x in grp) == 1)
-
-# Çdo grup duhet të ketë saktësisht numrin e kërkuar të lojtarëve për çdo javë
-for _, grp in groupby_keys(variables, ['Week', 'Group']):
-    model.Add(sum(x['CP_Var'] for x in grp) == players_per_group)
-
-# Siguro që dy lojtarë nuk janë në të njëjtin grup më shumë se një herë
-for p1, p2 in combinations(players, r=2):
-    players_together = []
-    for week in weeks:
-        for group in groups:
-            together = model.NewBoolVar(f"M_{p1}_{p2}_{week}_{group}")
-            players_together.append(together)
-            p1g = player_vars[p1, week, group]
-            p2g = player_vars[p2, week, group]
-            # Imposto që nëse të dy lojtarët janë në të njëjtin grup, `together` është 1
-            model.Add(p1g + p2g - together <= 1)
-    # Kufizo numrin total të herëve që dy lojtarë takohen në maksimum 1
-    model.Add(sum(players_together) <= 1)
-
-# Zgjidh modelin
-solver = cp_model.CpSolver()
-status = solver.Solve(model)
-print(solver.ResponseStats())
+from itertools import product, combinations
+
+
+def new_player_vars(model, n_players, n_weeks, n_groups):
+    """
+    Krijon ndryshoret x[player][week][group] si lista të dendura të indeksuara me numra.
+    Ndryshoret krijohen me radhë, prandaj indeksi i x[p][w][g] në model është
+    x[0][0][0].Index() + (p * n_weeks + w) * n_groups + g (e përdor parse_answer).
+    """
+    return [[[model.NewBoolVar(f"{player}_{week}_{group}") for group in range(n_groups)]
+             for week in range(n_weeks)]
+            for player in range(n_players)]
+
+
+def build_model(n_players, n_weeks, players_per_group):
+    """
+    Modeli origjinal: një BoolVar 'together' për çdo çift lojtarësh, javë dhe grup,
+    pra O(p²·w·g) ndryshore ndihmëse dhe pa thyerje simetrie.
+    Kthen (model, player_vars).
+    """
+    # Parametrat e nxjerrë
+    n_groups = n_players // players_per_group  # Numri i grupeve
+    players = range(n_players)  # Lojtarët
+    weeks = range(n_weeks)  # Javët
+    groups = range(n_groups)  # Grupet
+
+    # Inicializo modelin
+    model = cp_model.CpModel()
+
+    # Ndryshoret
+    x = new_player_vars(model, n_players, n_weeks, n_groups)
+
+    # Kufizimet
+
+    # Çdo lojtar duhet të jetë saktësisht në një grup për çdo javë
+    for player, week in product(players, weeks):
+        model.Add(sum(x[player][week]) == 1)
+
+    # Çdo grup duhet të ketë saktësisht numrin e kërkuar të lojtarëve për çdo javë
+    for week, group in product(weeks, groups):
+        model.Add(sum(x[player][week][group] for player in players) == players_per_group)
+
+    # Siguro që dy lojtarë nuk janë në të njëjtin grup më shumë se një herë
+    for p1, p2 in combinations(players, r=2):
+        players_together = []
+        for week in weeks:
+            for group in groups:
+                together = model.NewBoolVar(f"M_{p1}_{p2}_{week}_{group}")
+                players_together.append(together)
+                # Imposto që nëse të dy lojtarët janë në të njëjtin grup, `together` është 1
+                model.Add(x[p1][week][group] + x[p2][week][group] - together <= 1)
+        # Kufizo numrin total të herëve që dy lojtarë takohen në maksimum 1
+        model.Add(sum(players_together) <= 1)
+
+    return model, x
+
+
+def build_compact_model(n_players, n_weeks, players_per_group, symmetry_breaking=True, order_weeks=True):
+    """
+    Modeli kompakt: një tregues takimi m[p1, p2, javë] për çift dhe javë (jo për çdo grup),
+    pra O(p²·w) ndryshore ndihmëse. Mjafton kufiri m >= x[p1,w,g] + x[p2,w,g] - 1 për çdo grup,
+    sepse shuma e treguesve të një çifti kufizohet vetëm nga lart (<= 1).
+
+    Me symmetry_breaking=True:
+      - java 1 fiksohet në grupet kanonike (lojtari p në grupin p // k)
+      - lojtarët e grupit të parë të javës 1 (u takuan tashmë) vendosen në grupe të ndryshme
+        në çdo javë tjetër; lojtari i në grupin i
+      - grupet e tjera brenda një jave renditen sipas lojtarit më të vogël që kanë
+      - javët 2..w renditen sipas grupit të lojtarit k (i pari i grupit të dytë në javën 1);
+        me order_weeks=False kjo pjesë hiqet, që javët e zgjidhura më parë të mund të fiksohen
+    Kthen (model, player_vars).
+    """
+    n_groups = n_players // players_per_group
+    players = range(n_players)
+    weeks = range(n_weeks)
+    groups = range(n_groups)
+
+    model = cp_model.CpModel()
+    x = new_player_vars(model, n_players, n_weeks, n_groups)
+
+    for player, week in product(players, weeks):
+        model.AddExactlyOne(x[player][week])
+    for week, group in product(weeks, groups):
+        model.Add(sum(x[player][week][group] for player in players) == players_per_group)
+
+    for p1, p2 in combinations(players, r=2):
+        meets = []
+        for week in weeks:
+            meet = model.NewBoolVar(f"M_{p1}_{p2}_{week}")
+            meets.append(meet)
+            for group in groups:
+                model.AddBoolOr([x[p1][week][group].Not(), x[p2][week][group].Not(), meet])
+        model.Add(sum(meets) <= 1)
+    if symmetry_breaking and n_weeks:
+        # Java 1: grupet kanonike
+        for player in players:
+            model.Add(x[player][0][player // players_per_group] == 1)
+
+        fixed = min(players_per_group, n_groups)
+        for week in range(1, n_weeks):
+            # Lojtarët 0..k-1 u takuan në javën 1, prandaj janë në grupe të ndryshme
+            for player in range(fixed):
+                model.Add(x[player][week][player] == 1)
+            # Grupet e mbetura renditen sipas lojtarit më të vogël që përmbajnë
+            smallest = []
+            for group in range(fixed, n_groups):
+                first = model.NewIntVar(0, n_players, f"F_{week}_{group}")
+                # Lojtarët jashtë grupit marrin vlerën n_players, që të mos ndikojnë te minimumi
+                model.AddMinEquality(first, [player + (n_players - player) * (1 - x[player][week][group])
+                                             for player in players])
+                smallest.append(first)
+            for left, right in zip(smallest, smallest[1:]):
+                model.Add(left < right)
+
+        # Javët 2..w janë të këmbyeshme: renditen sipas grupit të lojtarit k
+        if order_weeks and n_groups > 1 and n_weeks > 2:
+            pivot = players_per_group
+            group_of = [sum(group * x[pivot][week][group] for group in groups)
+                        for week in range(1, n_weeks)]
+            for left, right in zip(group_of, group_of[1:]):
+                model.Add(left <= right)
+
+    return model, x
+
+
+def model_size(model):
+    """Kthen (numri i ndryshoreve, numri i kufizimeve) të modelit."""
+    proto = model.Proto()
+    return len(proto.variables), len(proto.constraints)
+
+
+def solve_model(model, time_limit=None, workers=None):
+    """
+    Zgjidh modelin me CP-SAT. 'workers' vendos num_search_workers (kërkim paralel në disa fije).
+    Kthen (solver, status, koha e zgjidhjes në sekonda).
+    """
+    solver = cp_model.CpSolver()
+    if time_limit is not None:
+        solver.parameters.max_time_in_seconds = time_limit
+    if workers:
+        solver.parameters.num_search_workers = workers
+    started = time.perf_counter()
+    status = solver.Solve(model)
+    return solver, status, time.perf_counter() - started
+
 
 # Parsimi dhe formatimi i zgjidhjes
-def parse_answer(variables):
-    solution = {}
-    for var in variables:
-        player, week, group = var['Player'], var['Week'], var['Group']
-        solution[player, week, group] = solver.Value(var['CP_Var'])
-
-    weeks = sorted(set(x[1] for x in solution))
-    groups = sorted(set(x[2] for x in solution))
-    answers = {}
-    for week in weeks:
-        answers[week] = {}
-        for group in groups:
-            ans = [k[0] for k, v in solution.items() if k[1] == week and k[2] == group and v]
-            answers[week][group] = sorted(ans)
+def parse_answer(solver, player_vars):
+    """
+    Dekodon zgjidhjen në një kalim të vetëm: vlerat lexohen një herë nga përgjigja e solver-it
+    dhe për çdo (lojtar, javë) gjendet grupi me vlerë 1 në pjesën e dendur të vektorit.
+    Kthen {java: {grupi: [lojtarët]}}; lojtarët dalin të renditur sepse iterohen me radhë.
+    """
+    n_weeks, n_groups = len(player_vars[0]), len(player_vars[0][0])
+    values = list(solver.ResponseProto().solution)
+    first = player_vars[0][0][0].Index()
+    answers = {week: {group: [] for group in range(n_groups)} for week in range(n_weeks)}
+    for player in range(len(player_vars)):
+        for week in range(n_weeks):
+            base = first + (player * n_weeks + week) * n_groups
+            answers[week][values.index(1, base, base + n_groups) - base].append(player)
     return answers
 
-if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-    ans = parse_answer(variables)
+
+def solve_schedule(n_players, n_weeks, players_per_group, compact=True, time_limit=None, workers=None):
+    """
+    Ndërton, zgjidh dhe dekodon një orar. Kthen (orari ose None, statusi, kohët),
+    ku 'kohët' ka ndarjen build / solve / decode në sekonda dhe madhësinë e modelit.
+    """
+    started = time.perf_counter()
+    if compact:
+        model, player_vars = build_compact_model(n_players, n_weeks, players_per_group)
+    else:
+        model, player_vars = build_model(n_players, n_weeks, players_per_group)
+    timings = {'build': time.perf_counter() - started, 'size': model_size(model)}
+
+    solver, status, timings['solve'] = solve_model(model, time_limit, workers)
+
+    schedule = None
+    started = time.perf_counter()
+    if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+        schedule = parse_answer(solver, player_vars)
+    timings['decode'] = time.perf_counter() - started
+    return schedule, solver.StatusName(status), timings
+
+
+def _apply_schedule(model, player_vars, schedule, fix=False):
+    """Vendos javët e një orari të mëparshëm si hint-e (ose si vlera fikse me fix=True)."""
+    for week, group_data in schedule.items():
+        for group, members in group_data.items():
+            for player in members:
+                if fix:
+                    model.Add(player_vars[player][week][group] == 1)
+                else:
+                    model.AddHint(player_vars[player][week][group], 1)
+
+
+def extend_schedule(n_players, players_per_group, max_weeks=None, time_budget=60.0, workers=None):
+    """
+    Zgjidhje inkrementale: orari zgjatet me nga një javë duke ruajtur javët e zgjidhura.
+      1. "fixed": javët e mëparshme fiksohen dhe zgjidhet vetëm java e re (model i vogël, i shpejtë)
+      2. "hinted": nëse kjo dështon, i gjithë orari rizgjidhet me javët e mëparshme si hint-e
+    Ndalet kur java tjetër provohet e pamundur, kur mbaron 'time_budget' ose në 'max_weeks'
+    (si parazgjedhje kufiri teorik (p - 1) // (k - 1)).
+    Kthen (orari më i gjatë i gjetur, lista e fazave me statusin dhe kohët për secilën).
+    """
+    if max_weeks is None:
+        max_weeks = (n_players - 1) // (players_per_group - 1)
+    deadline = time.perf_counter() + time_budget
+    schedule, phases = {}, []
+
+    for n_weeks in range(1, max_weeks + 1):
+        extended = None
+        for mode in ("fixed", "hinted"):
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            started = time.perf_counter()
+            model, player_vars = build_compact_model(n_players, n_weeks, players_per_group,
+                                                     order_weeks=(mode == "hinted"))
+            _apply_schedule(model, player_vars, schedule, fix=(mode == "fixed"))
+            build_time = time.perf_counter() - started
+
+            solver, status, solve_time = solve_model(model, remaining, workers)
+            phases.append({'weeks': n_weeks, 'mode': mode, 'status': solver.StatusName(status),
+                           'build': build_time, 'solve': solve_time})
+            if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+                extended = parse_answer(solver, player_vars)
+                break
+            if status != cp_model.INFEASIBLE:
+                # Mbaroi koha pa përgjigje
+                break
+        if extended is None:
+            break
+        schedule = extended
+
+    return schedule, phases
+
+
+def compare_models(n_players, n_weeks, players_per_group, time_limit=30.0):
+    """
+    Zgjidh të dy modelet (origjinal dhe kompakt me thyerje simetrie) me të njëjtin kufi kohe
+    dhe kthen për secilin madhësinë, statusin dhe kohën e zgjidhjes.
+    """
+    results = {}
+    for name, compact in (("origjinal", False), ("kompakt", True)):
+        _, status, timings = solve_schedule(n_players, n_weeks, players_per_group, compact, time_limit)
+        results[name] = {
+            'size': timings['size'],
+            'status': status,
+            'build': round(timings['build'], 3),
+            'time': round(timings['solve'], 3),
+        }
+    return results
+
+
+def print_schedule(ans):
     for week, group_data in ans.items():
         print(f"Java {week + 1}:")
         for group, members in group_data.items():
             print(f"  Grupi {group + 1}: {members}")
-else:
-    print("Nuk u gjet asnjë zgjidhje.")
+
+
+def main():
+    # Përkufizimi i problemit
+    n_players = int(input("Numri i lojtarëve: ")) # Numri i lojtarëve
+    n_weeks = int(input("Numri i javëve: ")) # Numri i javëve
+    players_per_group = int(input("Numri i lojtarëve për grup: ")) # Numri i lojtarëve për grup
+    incremental = input("Kërko numrin maksimal të javëve (deri në këtë numër) në mënyrë inkrementale? (p/j): ")
+
+    if incremental.strip().lower().startswith("p"):
+        time_budget = float(input("Buxheti kohor në sekonda: "))
+        ans, phases = extend_schedule(n_players, players_per_group, n_weeks, time_budget)
+        for phase in phases:
+            print(f"Java {phase['weeks']} ({phase['mode']}): {phase['status']}, "
+                  f"ndërtimi {phase['build']:.3f} s, zgjidhja {phase['solve']:.3f} s")
+        print(f"Numri më i madh i javëve të gjetura: {len(ans)}")
+        print_schedule(ans)
+        return
+
+    original, _ = build_model(n_players, n_weeks, players_per_group)
+    print("Madhësia e modelit origjinal (ndryshore, kufizime): %d, %d" % model_size(original))
+
+    # Ndërto, zgjidh dhe dekodo modelin kompakt
+    ans, status, timings = solve_schedule(n_players, n_weeks, players_per_group)
+    print("Madhësia e modelit kompakt (ndryshore, kufizime): %d, %d" % timings['size'])
+    print(f"Statusi: {status}")
+    print(f"Kohët: ndërtimi {timings['build']:.3f} s, zgjidhja {timings['solve']:.3f} s, "
+          f"dekodimi {timings['decode']:.4f} s")
+
+    if ans is not None:
+        print_schedule(ans)
+    else:
+        print("Nuk u gjet asnjë zgjidhje.")
+
+if __name__ == "__main__":
+    main()
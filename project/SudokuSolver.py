@@ -1,4 +1,12 @@
+import heapq
+import os
+import sys
+import time
 from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from ExactCover import solution_to_grid, sudoku_cover
 
 def is_valid(board, row, col, num):
     """Kontrollon nëse num mund të vendoset në qelizën (row, col) pa shkelur rregullat e Sudoku-së."""
@@ -62,6 +70,270 @@ def backtracking_solver(board):
 
     return True
 
+# Maskat e bitëve për motorin e shpejtë: biti d (1..9) është i ndezur nëse shifra d është e zënë.
+ALL_DIGITS = 0x3FE
+POPCOUNT = [bin(m).count("1") for m in range(1 << 10)]
+DIGIT_OF_BIT = {1 << d: d for d in range(1, 10)}
+CELL_BOX = [3 * (i // 27) + (i % 9) // 3 for i in range(81)]
+UNITS = (
+    [[r * 9 + c for c in range(9)] for r in range(9)]
+    + [[r * 9 + c for r in range(9)] for c in range(9)]
+    + [[(3 * (b // 3) + i) * 9 + 3 * (b % 3) + j for i in range(3) for j in range(3)] for b in range(9)]
+)
+
+def _place(cells, rows, cols, boxes, idx, bit):
+    """Vendos shifrën (si bit) në qelizën idx dhe përditëson maskat e rreshtit, kolonës dhe kutisë."""
+    cells[idx] = bit
+    rows[idx // 9] |= bit
+    cols[idx % 9] |= bit
+    boxes[CELL_BOX[idx]] |= bit
+
+def _propagate(cells, rows, cols, boxes):
+    """
+    Aplikon naked singles dhe hidden singles derisa të mos ketë më ndryshime.
+    Kthen (qeliza me më pak kandidatë, maska e saj), (-1, 0) nëse tabela është plot,
+    ose None nëse u gjet kontradiktë.
+    """
+    changed = True
+    while changed:
+        changed = False
+        best_idx, best_mask, best_count = -1, 0, 10
+
+        # Naked singles: qeliza me vetëm një kandidat
+        for idx in range(81):
+            if cells[idx]:
+                continue
+            mask = ALL_DIGITS & ~(rows[idx // 9] | cols[idx % 9] | boxes[CELL_BOX[idx]])
+            count = POPCOUNT[mask]
+            if count == 0:
+                return None
+            if count == 1:
+                _place(cells, rows, cols, boxes, idx, mask)
+                changed = True
+            elif count < best_count:
+                best_idx, best_mask, best_count = idx, mask, count
+        if changed:
+            continue
+
+        # Hidden singles: shifra që ka vetëm një vend të mundshëm në njësi
+        for unit in UNITS:
+            seen_once = 0
+            seen_twice = 0
+            placed = 0
+            for idx in unit:
+                if cells[idx]:
+                    placed |= cells[idx]
+                    continue
+                mask = ALL_DIGITS & ~(rows[idx // 9] | cols[idx % 9] | boxes[CELL_BOX[idx]])
+                seen_twice |= seen_once & mask
+                seen_once |= mask
+            if (seen_once | placed) != ALL_DIGITS:
+                return None
+            singles = seen_once & ~seen_twice
+            if not singles:
+                continue
+            for idx in unit:
+                if cells[idx]:
+                    continue
+                mask = singles & ~(rows[idx // 9] | cols[idx % 9] | boxes[CELL_BOX[idx]])
+                if mask:
+                    if mask & (mask - 1):
+                        return None  # Dy shifra "të vetme" në të njëjtën qelizë
+                    _place(cells, rows, cols, boxes, idx, mask)
+                    changed = True
+            if changed:
+                break
+
+        if not changed:
+            return best_idx, best_mask
+    return None
+
+def _bitmask_search(cells, rows, cols, boxes):
+    """Kërkim rekursiv: propagim, pastaj degëzim mbi qelizën me më pak kandidatë (MRV)."""
+    result = _propagate(cells, rows, cols, boxes)
+    if result is None:
+        return None
+    idx, mask = result
+    if idx == -1:
+        return cells
+
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        new_cells, new_rows, new_cols, new_boxes = cells[:], rows[:], cols[:], boxes[:]
+        _place(new_cells, new_rows, new_cols, new_boxes, idx, bit)
+        solved = _bitmask_search(new_cells, new_rows, new_cols, new_boxes)
+        if solved is not None:
+            return solved
+    return None
+
+def bitmask_solver(board):
+    """
+    Zgjidh Sudoku-n me maska bitësh për rreshtat, kolonat dhe kutitë,
+    propagim (naked/hidden singles) dhe zgjedhje të qelizës më të kufizuar (MRV).
+    Ashtu si backtracking_solver, e plotëson tabelën në vend dhe kthen True/False.
+    """
+    cells = [0] * 81
+    rows, cols, boxes = [0] * 9, [0] * 9, [0] * 9
+    for row in range(9):
+        for col in range(9):
+            num = board[row][col]
+            if num != 0:
+                idx = row * 9 + col
+                bit = 1 << num
+                # Shifrat e dhëna që përsëriten e bëjnë tabelën të pazgjidhshme
+                if (rows[row] | cols[col] | boxes[CELL_BOX[idx]]) & bit:
+                    return False
+                _place(cells, rows, cols, boxes, idx, bit)
+
+    solved = _bitmask_search(cells, rows, cols, boxes)
+    if solved is None:
+        return False
+
+    for idx, bit in enumerate(solved):
+        board[idx // 9][idx % 9] = DIGIT_OF_BIT[bit]
+    return True
+
+# Fqinjët (peers) e secilës qelizë: qelizat në të njëjtin rresht, kolonë ose kuti
+PEERS = [
+    tuple(sorted(set(UNITS[i // 9]) | set(UNITS[9 + i % 9]) | set(UNITS[18 + CELL_BOX[i]]) - {i}))
+    for i in range(81)
+]
+
+def _state_candidates(state, idx):
+    """Kthen maskën e kandidatëve për qelizën idx në një gjendje kompakte (bytes me 81 shifra)."""
+    used = 0
+    for p in PEERS[idx]:
+        used |= 1 << state[p]
+    return ALL_DIGITS & ~used
+
+def _state_freedom(state):
+    """Shuma e kandidatëve të qelizave bosh; përdoret për renditjen në beam search."""
+    total = 0
+    pos = state.find(0)
+    while pos != -1:
+        total += POPCOUNT[_state_candidates(state, pos)]
+        pos = state.find(0, pos + 1)
+    return total
+
+def _expand_state(state, idx):
+    """Kthen gjendjet pasardhëse duke vendosur çdo kandidat të vlefshëm në qelizën idx."""
+    children = []
+    mask = _state_candidates(state, idx)
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        child = bytearray(state)
+        child[idx] = DIGIT_OF_BIT[bit]
+        children.append(bytes(child))
+    return children
+
+def _state_to_board(state):
+    return [list(state[r * 9:(r + 1) * 9]) for r in range(9)]
+
+def bounded_bfs_solver(board, max_frontier=100000, fallback="dfs"):
+    """
+    BFS me memorie të kufizuar. Çdo gjendje ruhet si bytes me 81 shifra,
+    dhe qelizat e plotësuara kapërcehen pa kaluar nëpër radhë.
+    Kur radha arrin 'max_frontier', kërkimi kalon në:
+      - "dfs": depth-first, gjendjet e radhës provohen një nga një me backtracking mbi një gjendje
+        pune të vetme; për çdo nivel ruhet vetëm (qeliza, maska e shifrave të paprovuara),
+        kështu që gjendjet e ruajtura nuk e kalojnë kurrë 'max_frontier' (i plotë)
+      - "beam": ruan vetëm 'max_frontier' gjendjet më të lira në çdo nivel (jo i plotë)
+
+    Kthen (solution, stats) ku solution është tabelë 9x9 si te bfs_solver (ose None),
+    ndërsa stats përmban madhësinë maksimale të radhës, bajtët e përdorur dhe mënyrën përfundimtare.
+    """
+    if fallback not in ("dfs", "beam"):
+        raise ValueError("fallback duhet të jetë 'dfs' ose 'beam'")
+
+    start = bytes(num for row in board for num in row)
+    state_size = sys.getsizeof(start)
+    stats = {"peak_frontier": 1, "peak_bytes": state_size, "expanded": 0, "mode": "bfs", "peak_depth": 0}
+
+    def record(frontier_size):
+        if frontier_size > stats["peak_frontier"]:
+            stats["peak_frontier"] = frontier_size
+            stats["peak_bytes"] = frontier_size * state_size
+
+    # 1) BFS derisa radha të arrijë kufirin
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        idx = current.find(0)
+        if idx == -1:  # Nuk ka më qeliza bosh
+            return _state_to_board(current), stats
+        children = _expand_state(current, idx)
+        if len(queue) + len(children) > max_frontier:
+            queue.appendleft(current)  # nuk zgjerohet: radha do ta kalonte kufirin
+            break
+        stats["expanded"] += 1
+        queue.extend(children)
+        record(len(queue))
+
+    stats["mode"] = fallback
+
+    # 2a) DFS mbi gjendjet e mbetura: gjendjet më të cekëta provohen të parat. Secila bëhet
+    #     gjendje pune dhe ndryshohet në vend; fëmijët nuk ruhen si gjendje të plota, por si
+    #     korniza (qeliza, shifrat e paprovuara), një për nivel.
+    if fallback == "dfs":
+        while queue:
+            state = bytearray(queue.popleft())
+            record(len(queue) + 1)
+            idx = state.find(0)
+            if idx == -1:
+                return _state_to_board(state), stats
+            stats["expanded"] += 1
+            frames = [(idx, _state_candidates(state, idx))]
+            while frames:
+                idx, mask = frames[-1]
+                if not mask:
+                    frames.pop()
+                    state[idx] = 0
+                    continue
+                bit = mask & -mask  # shifra më e vogël provohet e para
+                frames[-1] = (idx, mask ^ bit)
+                state[idx] = DIGIT_OF_BIT[bit]
+                idx = state.find(0)
+                if idx == -1:
+                    return _state_to_board(state), stats
+                stats["expanded"] += 1
+                frames.append((idx, _state_candidates(state, idx)))
+                if len(frames) > stats["peak_depth"]:
+                    stats["peak_depth"] = len(frames)
+        return None, stats
+
+    # 2b) Beam search: zgjerojmë gjithë nivelin dhe mbajmë vetëm gjendjet më të lira.
+    #     Fëmijët prodhohen nga një gjenerator dhe heapq.nlargest mban vetëm 'max_frontier'
+    #     prej tyre, kështu që niveli i ri nuk e kalon kurrë kufirin.
+    level = list(queue)
+    del queue
+    while level:
+        for current in level:
+            if current.find(0) == -1:
+                return _state_to_board(current), stats
+        stats["expanded"] += len(level)
+        children = (child for current in level for child in _expand_state(current, current.find(0)))
+        level = heapq.nlargest(max_frontier, children, key=_state_freedom)
+        record(len(level))
+    return None, stats
+
+def exact_cover_solver(board):
+    """
+    Zgjidh Sudoku-n si problem të mbulimit të saktë (Algoritmi X).
+    E plotëson tabelën në vend dhe kthen True/False, ashtu si backtracking_solver.
+    """
+    solution = sudoku_cover(board).first_solution()
+    if solution is None:
+        return False
+    for r, row in enumerate(solution_to_grid(solution, 9)):
+        board[r][:] = row
+    return True
+
+def count_solutions(board):
+    """Numëron të gjitha zgjidhjet e tabelës me Algoritmin X."""
+    return sudoku_cover(board).count()
+
 def print_board(board):
     """Shfaq tabelën Sudoku."""
     for row in board:
@@ -108,6 +380,120 @@ def get_sample_sudoku(level):
     levels = {1: easy, 2: medium, 3: hard}
     return levels.get(level, easy)
 
+# Rreshti që shkruhet për enigmat pa zgjidhje ose me format të gabuar në mënyrën batch
+NO_SOLUTION = "-" * 81
+
+def parse_puzzle_line(line):
+    """
+    Kthen tabelën 9x9 nga një rresht me 81 karaktere (formati .sdk/.txt).
+    Qelizat bosh shënohen me '0' ose '.'. Kthen None nëse rreshti nuk është i vlefshëm.
+    """
+    line = line.strip()
+    if len(line) != 81:
+        return None
+    values = []
+    for ch in line:
+        if ch in ".0":
+            values.append(0)
+        elif "1" <= ch <= "9":
+            values.append(ord(ch) - 48)
+        else:
+            return None
+    return [values[r * 9:(r + 1) * 9] for r in range(9)]
+
+def solve_puzzle_line(line):
+    """Zgjidh një enigmë në formatin me 81 karaktere dhe kthen zgjidhjen në të njëjtin format."""
+    board = parse_puzzle_line(line)
+    if board is None or not bitmask_solver(board):
+        return NO_SOLUTION
+    return "".join(str(num) for row in board for num in row)
+
+def _solve_chunk(chunk):
+    """Zgjidh një copë (start_index, [rreshtat]) brenda procesit punëtor."""
+    start, lines = chunk
+    return start, [solve_puzzle_line(line) for line in lines]
+
+def _read_chunks(lines, chunk_size):
+    """Lexon rreshtat si rrjedhë dhe i ndan në copa (start_index, [rreshtat]), duke kapërcyer rreshtat bosh."""
+    puzzles = (line for line in lines if line.strip())
+    index = 0
+    while True:
+        chunk = list(islice(puzzles, chunk_size))
+        if not chunk:
+            return
+        yield index, chunk
+        index += len(chunk)
+
+def solve_batch(input_path, output_path, workers=None, chunk_size=2000, ordered=True):
+    """
+    Zgjidh një skedar me enigma (një për rresht, 81 karaktere) duke i shpërndarë copat
+    në një ProcessPoolExecutor. Skedari lexohet si rrjedhë dhe vetëm një numër i kufizuar
+    copash mbahen njëkohësisht në memorie.
+      - ordered=True: zgjidhjet shkruhen në renditjen e hyrjes
+      - ordered=False: zgjidhjet shkruhen sapo të gatshme si "indeksi zgjidhja"
+
+    Kthen (të zgjidhura, pa zgjidhje, sekonda, enigma/sekondë), ku "pa zgjidhje" janë rreshtat
+    e shkruar si NO_SOLUTION (format i gabuar ose enigmë e pazgjidhshme) dhe shpejtësia
+    llogaritet mbi të gjitha enigmat e përpunuara.
+    """
+    started = time.perf_counter()
+    solved = failed = 0
+    workers = workers or os.cpu_count() or 1
+    max_pending = 4 * workers
+
+    with open(input_path) as src, open(output_path, "w") as dst, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = _read_chunks(src, chunk_size)
+        pending = deque() if ordered else set()
+
+        def write_result(future):
+            nonlocal solved, failed
+            start, results = future.result()
+            if ordered:
+                dst.write("\n".join(results))
+            else:
+                dst.write("\n".join(f"{start + i} {res}" for i, res in enumerate(results)))
+            dst.write("\n")
+            unsolved = results.count(NO_SOLUTION)
+            failed += unsolved
+            solved += len(results) - unsolved
+
+        for chunk in chunks:
+            future = executor.submit(_solve_chunk, chunk)
+            if ordered:
+                pending.append(future)
+                if len(pending) >= max_pending:
+                    write_result(pending.popleft())
+            else:
+                pending.add(future)
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for finished in done:
+                        write_result(finished)
+
+        if ordered:
+            while pending:
+                write_result(pending.popleft())
+        else:
+            for finished in wait(pending).done:
+                write_result(finished)
+
+    elapsed = time.perf_counter() - started
+    rate = (solved + failed) / elapsed if elapsed > 0 else 0.0
+    return solved, failed, elapsed, rate
+
+def batch_main(argv):
+    """Hyrja për mënyrën batch: SudokuSolver.py hyrja.txt dalja.txt [punëtorë] [--unordered]"""
+    ordered = "--unordered" not in argv
+    args = [a for a in argv if a != "--unordered"]
+    if len(args) < 2:
+        print("Përdorimi: python SudokuSolver.py hyrja.txt dalja.txt [punëtorë] [--unordered]")
+        return
+    workers = int(args[2]) if len(args) > 2 else None
+    solved, failed, elapsed, rate = solve_batch(args[0], args[1], workers=workers, ordered=ordered)
+    print(f"U zgjidhën {solved} enigma, {failed} pa zgjidhje ose me format të gabuar, "
+          f"për {elapsed:.2f} s ({rate:.0f} enigma/s)")
+
 def main():
     print("Zgjidh një nivel të Sudoku-së:")
     print("1 - Easy")
@@ -120,6 +506,13 @@ def main():
     print("\nTabela fillestare:")
     print_board(board)
 
+    bitmask_board = [row[:] for row in board]
+    print("\nZgjidhje me Bitmask (MRV + propagim):")
+    if bitmask_solver(bitmask_board):
+        print_board(bitmask_board)
+    else:
+        print("Nuk u gjet zgjidhje.")
+
     print("\nZgjidhje me Backtracking:")
     if backtracking_solver(board):
         print_board(board)
@@ -134,5 +527,17 @@ def main():
     else:
         print("Nuk u gjet zgjidhje.")
 
+    print("\nZgjidhje me BFS të kufizuar në memorie:")
+    solution, stats = bounded_bfs_solver(get_sample_sudoku(level))
+    if solution:
+        print_board(solution)
+    else:
+        print("Nuk u gjet zgjidhje.")
+    print(f"Radha maksimale: {stats['peak_frontier']} gjendje, "
+          f"{stats['peak_bytes']} bajt, mënyra: {stats['mode']}")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        batch_main(sys.argv[1:])
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,37 @@
+import importlib.util
+import os
+
+import pytest
+
+_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "Second and Third Project", "Sat-Problem.py")
+_spec = importlib.util.spec_from_file_location("sat_problem", _PATH)
+sat_problem = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sat_problem)
+
+
+def test_capacity_list_must_match_table_count():
+    with pytest.raises(ValueError):
+        sat_problem.solve_party_seating(6, 3, [2, 4], must_pairs=[(0, 1), (1, 2)])
+
+
+def test_load_seating_reports_line_of_bad_capacity(tmp_path):
+    path = tmp_path / "seating.csv"
+    path.write_text("guest,a\nguest,b\ntable,dy\n")
+    with pytest.raises(ValueError, match="rreshti 3"):
+        sat_problem.load_seating(str(path))
+
+
+def test_reseating_counts_displaced_free_guests():
+    # Tavolina 0: çiftet (0, 1) dhe (2, 3), që tani s'duhet të ulen bashkë.
+    # Tavolina 1: katër mysafirë të lirë. Tavolinat 2 dhe 3: tre mysafirë që s'mund të ulen
+    # me 2 dhe një vend bosh secila. Çifti (0, 1) në tavolinën 1 zhvendos dy mysafirë të lirë
+    # (4 lëvizje); në tavolinën 2 ose 3 lëviz vetëm një mysafir tjetër (3 lëvizje).
+    previous = {0: 0, 1: 0, 2: 0, 3: 0, 4: 1, 5: 1, 6: 1, 7: 1,
+                8: 2, 9: 2, 10: 2, 11: 3, 12: 3, 13: 3}
+    must_pairs = [(0, 1), (2, 3)]
+    must_not_pairs = [(0, 2)] + [(g, 2) for g in range(8, 14)]
+    status, assignment = sat_problem._solve_seating(
+        14, 4, 4, must_not_pairs, must_pairs, {}, guests=list(range(14)), previous=previous)
+    assert status == sat_problem.cp_model.OPTIMAL
+    assert assignment[0] != assignment[2]
+    assert sum(1 for g, t in previous.items() if assignment[g] != t) == 3
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "project"))
+
+from SudokuSolver import bounded_bfs_solver, get_sample_sudoku  # noqa: E402
+
+
+def _is_solution(puzzle, solution):
+    """Zgjidhja respekton shifrat e dhëna dhe çdo rresht, kolonë e bllok ka 1..9."""
+    digits = set(range(1, 10))
+    rows = [set(row) for row in solution]
+    cols = [set(solution[r][c] for r in range(9)) for c in range(9)]
+    boxes = [set(solution[br + r][bc + c] for r in range(3) for c in range(3))
+             for br in (0, 3, 6) for bc in (0, 3, 6)]
+    givens = all(puzzle[r][c] in (0, solution[r][c]) for r in range(9) for c in range(9))
+    return givens and all(group == digits for group in rows + cols + boxes)
+
+
+@pytest.mark.parametrize("level", [2, 3])
+@pytest.mark.parametrize("max_frontier", [10, 100, 1000])
+def test_dfs_fallback_stays_within_max_frontier(level, max_frontier):
+    puzzle = get_sample_sudoku(level)
+    solution, stats = bounded_bfs_solver([row[:] for row in puzzle], max_frontier, "dfs")
+    assert stats["mode"] == "dfs"
+    assert stats["peak_frontier"] <= max_frontier
+    assert solution is not None and _is_solution(puzzle, solution)